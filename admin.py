@@ -0,0 +1,78 @@
+"""Contact-form inbox for the site owner; a separate entry point, not linked from the portfolio.
+
+    streamlit run admin.py
+
+Requires ``[ADMIN] PASSWORD = "..."`` in ``.streamlit/secrets.toml`` next to the ``[DB]`` section.
+"""
+from __future__ import annotations
+
+import hmac
+
+import psycopg2
+import streamlit as st
+
+from contact_store import fetch_inbox_page
+
+
+def _admin_password() -> str | None:
+    try:
+        return st.secrets["ADMIN"]["PASSWORD"]
+    except (KeyError, FileNotFoundError):
+        return None
+
+
+def _require_login() -> None:
+    """Stop the script unless this session has entered the admin password."""
+    if st.session_state.get("admin-authenticated"):
+        return
+    password = _admin_password()
+    if not password:
+        st.error("The inbox is disabled: set [ADMIN] PASSWORD in .streamlit/secrets.toml.")
+        st.stop()
+    with st.form("admin-login"):
+        attempt = st.text_input("Password", type="password")
+        if st.form_submit_button("Sign in"):
+            if hmac.compare_digest(attempt.encode("utf-8"), password.encode("utf-8")):
+                st.session_state["admin-authenticated"] = True
+                st.rerun()
+            st.error("Wrong password.")
+    st.stop()
+
+
+def _page_cursors(search: str) -> list:
+    """Cursors of the pages visited so far for this search; the last one is the current page."""
+    if st.session_state.get("inbox-search") != search:
+        st.session_state["inbox-search"] = search
+        st.session_state["inbox-cursors"] = [None]
+    return st.session_state["inbox-cursors"]
+
+
+def main() -> None:
+    st.set_page_config(page_title="Contact inbox", page_icon="📬", layout="wide")
+    _require_login()
+    st.title("Contact inbox")
+
+    search = st.text_input("Search name or email (prefix)", key="inbox-search-input").strip()
+    cursors = _page_cursors(search)
+    try:
+        rows, next_cursor = fetch_inbox_page(cursors[-1], search)
+    except (psycopg2.Error, KeyError, FileNotFoundError) as err:
+        st.error(f"Could not load messages: {err}")
+        return
+
+    st.caption(f"Page {len(cursors)} - {len(rows)} messages, newest first")
+    columns = ("id", "received", "name", "email", "message")
+    st.dataframe([dict(zip(columns, row)) for row in rows], hide_index=True, width="stretch")
+
+    newer, older = st.columns(2)
+    # Buttons push or pop a cursor and rerun, so each rerun reads exactly one page
+    if newer.button("Newer", disabled=len(cursors) == 1):
+        cursors.pop()
+        st.rerun()
+    if older.button("Older", disabled=next_cursor is None):
+        cursors.append(next_cursor)
+        st.rerun()
+
+
+if __name__ == "__main__":
+    main()
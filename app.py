@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import base64
 import re
+import time
 from contextlib import contextmanager
 from pathlib import Path
 from textwrap import dedent
@@ -10,11 +11,15 @@ from typing import Dict, List
 import streamlit as st
 
 from components.contact import render_contact_section
+from components.css_bundle import load_bundle
 from components.education import render_certifications, render_education
 from components.experience import render_experience
 from components.flip_card import render_project_cards
+from components.fragment_cache import cached_fragment
 from components.github_stats import render_github_stats
-from components.resume import load_resume_base64, render_resume_section
+from components.icon_sprite import SPRITE_PATH, icon_html
+from components.images import responsive_image_html
+from components.resume import render_resume_section, resume_href
 from components.skills import render_skills
 from components.social_icons import get_social_icon_url
 from data import (
@@ -30,12 +35,19 @@ from data import (
     GITHUB_CONFIG,
     ML_LAB,
     PROFILE,
+    RENDER_CONFIG,
     RESUME,
     SKILL_GROUPS,
 )
 
-from github_api import fetch_github_summary, fetch_portfolio_repositories, fetch_repository
+from github_api import (
+    fetch_github_summary,
+    fetch_portfolio_repositories,
+    fetch_repositories,
+    shortlist_misses,
+)
 from live_demos import apply_live_demo_links
+from snapshot import restore_once as restore_github_snapshot
 
 def _load_sentiment_words() -> tuple[set[str], set[str]]:
     # Load positive and negative words from external files.
@@ -54,10 +66,11 @@ def _load_sentiment_words() -> tuple[set[str], set[str]]:
 POSITIVE_TERMS, NEGATIVE_TERMS = _load_sentiment_words()
 
 def _load_css() -> None:
-    # Load and apply custom CSS styles for the app.
-    css_path = Path(__file__).parent / "styles" / "style.css"
-    with css_path.open("r", encoding="utf-8") as css_file:
-        st.markdown(f"<style>{css_file.read()}</style>", unsafe_allow_html=True)
+    # Apply the prebuilt stylesheet bundle. The tag is resolved once per session but written on
+    # every rerun, since Streamlit drops elements a rerun does not emit again.
+    if "css_tag" not in st.session_state:
+        st.session_state["css_tag"] = load_bundle().tag
+    st.markdown(st.session_state["css_tag"], unsafe_allow_html=True)
 
 def _ensure_assets() -> None:
     # Ensure essential assets like profile picture and resume exist.
@@ -86,16 +99,6 @@ def _ensure_assets() -> None:
         # Placeholder for resume handling logic.
         pass
 
-def _image_data_uri(path_str: str) -> str:
-    # Convert image file to a data URI for embedding in HTML.
-    path = Path(path_str)
-    if path.exists():
-        mime_type = "image/png" if path.suffix.lower() == ".png" else "image/jpeg"
-        with path.open("rb") as image_file:
-            base64_data = base64.b64encode(image_file.read()).decode("utf-8")
-        return f"data:{mime_type};base64,{base64_data}"
-    return path_str
-
 def _lexicon_sentiment(text: str) -> tuple[str, float]:
     # Analyze sentiment of the given text based on predefined lexicon.
     words = re.findall(r"[\w']+", text.lower())
@@ -118,27 +121,28 @@ def _lexicon_sentiment(text: str) -> tuple[str, float]:
         # Neutral sentiment.
         return "neutral", score
 
-def _render_nav() -> None:
-    # Render the navigation bar with links to different sections.
-    nav_items = [
-        ("hero", "Hero"),
-        ("about", "About"),
-        ("experience", "Experience"),
-        ("education", "Education"),
-        ("skills", "Skills"),
-        ("projects", "Projects"),
-        ("github", "GitHub"),
-        ("resume", "Resume"),
-        ("contact", "Contact"),
-        ("lab", "ML Lab"),
-    ]
-    links = "".join(f"<a href='#{slug}'>{label}</a>" for slug, label in nav_items)
-    logo_src = _image_data_uri(PROFILE.get("logo", ""))
+NAV_ITEMS = [
+    ("hero", "Hero"),
+    ("about", "About"),
+    ("experience", "Experience"),
+    ("education", "Education"),
+    ("skills", "Skills"),
+    ("projects", "Projects"),
+    ("github", "GitHub"),
+    ("resume", "Resume"),
+    ("contact", "Contact"),
+    ("lab", "ML Lab"),
+]
+
+def _nav_markup() -> str:
+    # Build the navigation bar markup.
+    links = "".join(f"<a href='#{slug}'>{label}</a>" for slug, label in NAV_ITEMS)
+    logo_html = responsive_image_html(PROFILE.get("logo", ""), "logo", profile="logo")
     nav_markup = dedent(
         f"""
         <nav class='floating-nav'>
                 <div class='nav-logo'>
-                    {f"<img src='{logo_src}' alt='logo' />" if PROFILE.get('logo')
+                    {logo_html if PROFILE.get('logo')
                       else '<span  class="nav-eyebrow">Portfolio</span>'}
                 </div>
             <div class='nav-links'>{links}</div>
@@ -146,8 +150,24 @@ def _render_nav() -> None:
         </nav>
         """
     ).strip()
+    return nav_markup
+
+def _render_nav() -> None:
+    # Render the navigation bar with links to different sections.
+    nav_markup = cached_fragment(
+        "nav", [NAV_ITEMS, PROFILE.get("logo")], _nav_markup, assets=[PROFILE.get("logo", "")]
+    )
     st.markdown(nav_markup, unsafe_allow_html=True)
 
+def _freshness_label(fetched_at: float | None) -> str:
+    # Describe how old the GitHub data on screen is.
+    if fetched_at is None:
+        return "GitHub data unavailable right now"
+    minutes = int((time.time() - fetched_at) // 60)
+    if minutes < 1:
+        return "Synced with GitHub just now"
+    return f"Synced with GitHub {minutes} min ago"
+
 def _anchor(slug: str) -> None:
     # Add an anchor for navigation to specific sections.
     st.markdown(f"<span id='{slug}' class='section-anchor'></span>", unsafe_allow_html=True)
@@ -167,25 +187,26 @@ def _section_shell(anchor: str | None = None, title: str | None = None) -> None:
 
 def _social_cta(label: str, url: str) -> str:
     # Generate a call-to-action button for social links.
-    icon_url = get_social_icon_url(label)
+    icon_markup = icon_html(get_social_icon_url(label), f"{label} icon")
     return (
         f"<a class='ghost-btn hero-cta' href='{url}' target='_blank' rel='noopener'>"
-        f"<span class='social-icon'><img src='{icon_url}' alt='{label} icon' loading='lazy' /></span>"
+        f"<span class='social-icon'>{icon_markup}</span>"
         f"<span>{label}</span>"
         "</a>"
     )
 
-def _render_hero(summary: Dict) -> None:
-    # Render the hero section with profile details and stats.
+def _hero_markup() -> str:
+    # Build the hero section with profile details and stats.
     hero_stats = "".join(
         f"<div class='stat-tile'><p class='eyebrow'>{stat['label']}</p><h3>{stat['value']}</h3></div>"
         for stat in PROFILE["hero_stats"]
     )
     ctas = "".join(_social_cta(label, url) for label, url in PROFILE["socials"].items() if label != "Resume")
-    resume_b64 = load_resume_base64(RESUME.get("path", ""))
-    resume_href = f"data:application/pdf;base64,{resume_b64}" if resume_b64 else "#resume"
-    resume_btn = f"<a class='solid-btn' href='{resume_href}' download>Download Resume</a>"
-    avatar_src = _image_data_uri(PROFILE["avatar"])
+    resume_btn = (
+        f"<a class='solid-btn' href='{resume_href(RESUME.get('path', '')) or '#resume'}' "
+        f"download='{RESUME.get('file_name', '')}'>Download Resume</a>"
+    )
+    avatar_html = responsive_image_html(PROFILE["avatar"], "Profile portrait", profile="avatar")
     hero_meta = "".join(
         f"<div><p class='eyebrow'>{label}</p><h4>{value}</h4></div>"
         for label, value in [
@@ -202,7 +223,7 @@ def _render_hero(summary: Dict) -> None:
             <div class='hero-card hero-card--expanded'>
                 <div class='hero-top'>
                     <div class='hero-avatar-card'>
-                        <img src='{avatar_src}' alt='Profile portrait'/>
+                        {avatar_html}
                         <p class='hero-bio' style="padding:12px 2px 2px 1px;">{PROFILE['role']}</p>
                     </div>
                     <div class='hero-copy'>
@@ -218,28 +239,39 @@ def _render_hero(summary: Dict) -> None:
         </section>
         """
     ).strip()
+    return hero_markup
+
+def _render_hero() -> None:
+    # Render the hero section; it only depends on PROFILE, RESUME and their files.
+    hero_markup = cached_fragment(
+        "hero",
+        [PROFILE, RESUME],
+        _hero_markup,
+        assets=[PROFILE.get("avatar", ""), RESUME.get("path", ""), str(SPRITE_PATH)],
+    )
     st.markdown(hero_markup, unsafe_allow_html=True)
 
-def _render_about() -> None:
-    # Render the about section with personal highlights and focus areas.
+def _about_markup() -> str:
+    # Build the about section with personal highlights and focus areas.
     highlights = "".join(f"<li>{point}</li>" for point in ABOUT["highlights"])
     focus = "".join(f"<span class='chip'>{item}</span>" for item in ABOUT["focus"])
-    st.markdown(
-        f"""
+    return f"""
         <section class='section-shell'>
             <h2>About</h2>
             <p>{ABOUT['headline']}</p>
             <ul>{highlights}</ul>
             <div class='badge-row'>{focus}</div>
         </section>
-        """,
-        unsafe_allow_html=True,
-    )
+        """
+
+def _render_about() -> None:
+    # Render the about section.
+    st.markdown(cached_fragment("about", ABOUT, _about_markup), unsafe_allow_html=True)
 
 def _render_experience() -> None:
     # Render the experience section with work history.
     _anchor("experience")
-    experience_markup = render_experience(EXPERIENCE)
+    experience_markup = cached_fragment("experience", EXPERIENCE, lambda: render_experience(EXPERIENCE))
     if not experience_markup:
         st.info("Work experience will appear here once it's added.")
         return
@@ -256,8 +288,10 @@ def _render_experience() -> None:
 def _render_education_section() -> None:
     # Render the education section with degrees and certifications.
     _anchor("education")
-    education_markup = render_education(EDUCATION)
-    cert_markup = render_certifications(CERTIFICATIONS)
+    education_markup = cached_fragment("education", EDUCATION, lambda: render_education(EDUCATION))
+    cert_markup = cached_fragment(
+        "certifications", CERTIFICATIONS, lambda: render_certifications(CERTIFICATIONS)
+    )
     if not education_markup and not cert_markup:
         st.info("Add your education details to showcase degrees and certifications here.")
         return
@@ -272,8 +306,17 @@ def _render_education_section() -> None:
         unsafe_allow_html=True,
     )
 
-def _render_projects(username: str, topic: str) -> tuple[List[Dict], List[Dict]]:
-    # Render the projects section with GitHub repositories and featured projects.
+def _load_github_repos(username: str, topic: str) -> List[Dict]:
+    # Fetch the portfolio feed once per full run; the projects fragment reuses it on its own reruns.
+    # No spinner: the projects skeleton already says the feed is loading, where the cards will appear.
+    feed_args = {"username": username, "topic": topic, "backend": GITHUB_CONFIG.get("backend", "rest")}
+    github_repos = fetch_portfolio_repositories(**feed_args)
+    return apply_live_demo_links(github_repos)
+
+@st.fragment
+def _render_projects(username: str, topic: str, github_repos: List[Dict]) -> List[Dict]:
+    # Render the projects section with GitHub repositories and featured projects. The feed controls
+    # only rerun this fragment; the returned list is only used on full runs.
     _anchor("projects")
 
     # st.markdown("""
@@ -293,12 +336,7 @@ def _render_projects(username: str, topic: str) -> tuple[List[Dict], List[Dict]]
     with col_right:
         live_toggle = st.toggle("Live demos only", value=False, key="live-only-toggle")
 
-    with st.spinner("Fetching projects from GitHub..."):
-        github_repos = fetch_portfolio_repositories(username=username, topic=topic)
-        github_repos = apply_live_demo_links(github_repos)
-
     featured_topic_tags = {tag.lower() for tag in FEATURED_TOPIC_TAGS} or {"feature"}
-    shortlist_fallback_map = {key.lower(): value for key, value in SHORTLIST_FALLBACKS.items()}
 
     featured_candidates = [
         repo
@@ -340,21 +378,22 @@ def _render_projects(username: str, topic: str) -> tuple[List[Dict], List[Dict]]
         shortlist_matches: List[Dict] = []
         fallback_matches: List[Dict] = []
 
+        # Resolve every shortlist miss in one call instead of one blocking fetch per name.
+        hydrated_map = fetch_repositories(
+            username=username,
+            names=shortlist_misses(filtered, PROJECT_SHORTLIST),
+            fallbacks=SHORTLIST_FALLBACKS,
+            backend=GITHUB_CONFIG.get("backend", "rest"),
+        )
+
         for desired in PROJECT_SHORTLIST:
-            key = desired.lower()
-            match = name_map.get(key)
+            match = name_map.get(desired.lower())
             if match:
                 shortlist_matches.append(match)
+            elif hydrated_map.get(desired):
+                fallback_matches.append(hydrated_map[desired])
             else:
-                hydrated = fetch_repository(username=username, repo_name=desired)
-                if hydrated:
-                    fallback_matches.append(hydrated)
-                else:
-                    fallback = shortlist_fallback_map.get(key)
-                    if fallback:
-                        fallback_matches.append({**fallback})
-                    else:
-                        missing_shortlist.append(desired)
+                missing_shortlist.append(desired)
 
         if fallback_matches:
             fallback_matches = apply_live_demo_links(fallback_matches)
@@ -368,14 +407,33 @@ def _render_projects(username: str, topic: str) -> tuple[List[Dict], List[Dict]]
         )
 
     render_project_cards(filtered)
-    st.caption(f"{len(filtered)} projects - {source_choice}")
+    feed_caption = f"{len(filtered)} projects - {source_choice}"
+    if using_github_feed:
+        feed_args = {"username": username, "topic": topic, "backend": GITHUB_CONFIG.get("backend", "rest")}
+        feed_caption += f" · {_freshness_label(fetch_portfolio_repositories.last_updated(**feed_args))}"
+    st.caption(feed_caption)
 
     # st.markdown("""
     #     </div>
     # """, unsafe_allow_html=True)
 
-    return github_repos, filtered
+    return filtered
 
+@st.fragment
+def _render_skills_section() -> None:
+    # Render the skills grid; changing the category filter only reruns this fragment.
+    skills_markup = render_skills(SKILL_GROUPS)
+    st.markdown(
+        f"""
+        <section class='section-shell'>
+            <h2>Skills</h2>
+            {skills_markup}
+        </section>
+        """,
+        unsafe_allow_html=True,
+    )
+
+@st.fragment
 def _render_ml_lab() -> None:
     # Render the ML Lab section with quick demos for sentiment analysis and resume screening.
     _anchor("lab")
@@ -424,7 +482,45 @@ def _render_ml_lab() -> None:
         unsafe_allow_html=True,
     )
 
+def _record_timing(label: str, start: float) -> None:
+    # Keep milliseconds since the start of the run, per milestone, for benchmarks and debugging.
+    st.session_state.setdefault("render_timings", {})[label] = (time.perf_counter() - start) * 1000
+
+def _deferred_slot(title: str, message: str):
+    # Reserve a section's place in the page with a skeleton until its data arrives.
+    slot = st.empty()
+    slot.markdown(
+        f"<section class='section-shell section-skeleton'><h2>{title}</h2><p>{message}</p></section>",
+        unsafe_allow_html=True,
+    )
+    return slot
+
+def _render_github_sections(projects_slot, github_slot) -> None:
+    # Fetch GitHub data and replace the project and snapshot skeletons with the real sections.
+    github_repos = _load_github_repos(GITHUB_CONFIG["username"], GITHUB_CONFIG["topic"])
+    with projects_slot.container():
+        showcased_projects = _render_projects(GITHUB_CONFIG["username"], GITHUB_CONFIG["topic"], github_repos)
+
+    gh_summary = fetch_github_summary(GITHUB_CONFIG["username"])
+    summary_for_stats = dict(gh_summary)
+    if github_repos:
+        summary_for_stats["total_stars"] = sum(repo.get("stars", 0) for repo in github_repos)
+        summary_for_stats["latest_repo"] = github_repos[0].get("name", "")
+    else:
+        summary_for_stats.setdefault("total_stars", 0)
+        summary_for_stats.setdefault("latest_repo", "")
+
+    with github_slot.container():
+        _anchor("github")
+        st.subheader("GitHub Snapshot")
+        st.markdown("<p class='subtle-subhead'>Contribution activity</p>", unsafe_allow_html=True)
+        st.caption(_freshness_label(fetch_github_summary.last_updated(GITHUB_CONFIG["username"])))
+
+        spotlight_pool = showcased_projects or github_repos
+        render_github_stats(summary_for_stats, spotlight_pool)
+
 def main() -> None:
+    render_start = time.perf_counter()
     st.set_page_config(
         page_title="Shikher Jain Data Scientist & AI/ML Engineer",
         page_icon="assets/logo-SJ.png",
@@ -433,14 +529,15 @@ def main() -> None:
     )
 
     _ensure_assets()
+    restore_github_snapshot(GITHUB_CONFIG)
     _load_css()
     
     _render_nav()
     st.markdown("<div class='app-shell'>", unsafe_allow_html=True)
 
     _anchor("hero")
-    gh_summary = fetch_github_summary(GITHUB_CONFIG["username"])
-    _render_hero(gh_summary)
+    _render_hero()
+    _record_timing("hero", render_start)
 
     st.markdown("<hr/>", unsafe_allow_html=True)
     _anchor("about")
@@ -455,36 +552,14 @@ def main() -> None:
 
     st.markdown("<hr/>", unsafe_allow_html=True)
     _anchor("skills")
-    skills_markup = render_skills(SKILL_GROUPS)
-    st.markdown(
-        f"""
-        <section class='section-shell'>
-            <h2>Skills</h2>
-            {skills_markup}
-        </section>
-        """,
-        unsafe_allow_html=True,
-    )
+    _render_skills_section()
 
     st.markdown("<hr/>", unsafe_allow_html=True)
-
-    github_repos, showcased_projects = _render_projects(GITHUB_CONFIG["username"], GITHUB_CONFIG["topic"])
-
-    summary_for_stats = dict(gh_summary)
-    if github_repos:
-        summary_for_stats["total_stars"] = sum(repo.get("stars", 0) for repo in github_repos)
-        summary_for_stats["latest_repo"] = github_repos[0].get("name", "")
-    else:
-        summary_for_stats.setdefault("total_stars", 0)
-        summary_for_stats.setdefault("latest_repo", "")
-
+    projects_slot = _deferred_slot("Projects", "Fetching projects from GitHub...")
     st.markdown("<hr/>", unsafe_allow_html=True)
-    _anchor("github")
-    st.subheader("GitHub Snapshot")
-    st.markdown("<p class='subtle-subhead'>Contribution activity</p>", unsafe_allow_html=True)
-
-    spotlight_pool = showcased_projects or github_repos
-    render_github_stats(summary_for_stats, spotlight_pool)
+    github_slot = _deferred_slot("GitHub Snapshot", "Loading contribution activity...")
+    if not RENDER_CONFIG.get("progressive", True):
+        _render_github_sections(projects_slot, github_slot)
 
     st.markdown("<hr/>", unsafe_allow_html=True)
     _render_ml_lab()
@@ -496,6 +571,11 @@ def main() -> None:
     st.markdown("<hr/>", unsafe_allow_html=True)
     _anchor("contact")
     render_contact_section(CONTACT)
+    _record_timing("static", render_start)
+
+    if RENDER_CONFIG.get("progressive", True):
+        _render_github_sections(projects_slot, github_slot)
+    _record_timing("complete", render_start)
 
 if __name__ == "__main__":
     main()
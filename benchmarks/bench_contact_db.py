@@ -0,0 +1,94 @@
+"""Import time of the contact component and per-submit latency, per-submit connect vs pooled.
+
+Run from the repo root against a throwaway local Postgres configured in .streamlit/secrets.toml
+(``[DB]`` section; add ``DB_SSLMODE = "disable"`` if the server has no TLS):
+
+    python benchmarks/bench_contact_db.py
+
+"connect per submit" is what the form did before (connect, insert, commit, close); "pooled" goes
+through contact_store.insert_message. Rows are written to ``contact_form`` and deleted afterwards.
+"outbox" is what the form waits for now: a local SQLite commit (to a temporary file here).
+"""
+from __future__ import annotations
+
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import psycopg2  # noqa: E402
+
+import contact_store  # noqa: E402
+from contact_outbox import Outbox  # noqa: E402
+
+SUBMITS = 50
+MARKER = "bench_contact_db"
+
+_IMPORT_SNIPPET = "import time; s = time.perf_counter(); import components.contact; print(time.perf_counter() - s)"
+
+
+def import_seconds() -> float:
+    runs = [
+        float(subprocess.run([sys.executable, "-c", _IMPORT_SNIPPET], cwd=ROOT, capture_output=True, text=True, check=True).stdout)
+        for _ in range(5)
+    ]
+    return statistics.median(runs)
+
+
+def connect_per_submit() -> float:
+    start = time.perf_counter()
+    conn = psycopg2.connect(**contact_store._connect_kwargs())
+    cursor = conn.cursor()
+    cursor.execute(
+        "INSERT INTO contact_form (name, email, message) VALUES (%s, %s, %s)", (MARKER, MARKER, MARKER)
+    )
+    conn.commit()
+    conn.close()
+    return time.perf_counter() - start
+
+
+def pooled_submit() -> float:
+    start = time.perf_counter()
+    contact_store.insert_message(MARKER, MARKER, MARKER)
+    return time.perf_counter() - start
+
+
+def outbox_submit(outbox: Outbox) -> float:
+    start = time.perf_counter()
+    outbox.add(MARKER, MARKER, MARKER)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    start = time.perf_counter()
+    psycopg2.connect(**contact_store._connect_kwargs()).close()
+    print(f"{'one TLS connect (import-time cost before)':>44} {(time.perf_counter() - start) * 1000:>8.1f} ms")
+    print(f"{'import components.contact (now)':>44} {import_seconds() * 1000:>8.1f} ms")
+
+    contact_store.ensure_schema()
+    tmp_dir = tempfile.TemporaryDirectory()
+    outbox = Outbox(Path(tmp_dir.name) / "outbox.db")
+    submits = (
+        ("connect per submit", connect_per_submit),
+        ("pooled", pooled_submit),
+        ("outbox", lambda: outbox_submit(outbox)),
+    )
+    try:
+        for label, submit in submits:
+            samples = sorted(submit() for _ in range(SUBMITS))
+            p95 = samples[int(len(samples) * 0.95) - 1]
+            print(f"{label + ' (median / p95)':>44} {statistics.median(samples) * 1000:>8.1f} ms {p95 * 1000:>8.1f} ms")
+    finally:
+        with contact_store.connection() as conn, conn.cursor() as cursor:
+            cursor.execute("DELETE FROM contact_form WHERE name = %s", (MARKER,))
+        contact_store.close_pool()
+        tmp_dir.cleanup()
+
+
+if __name__ == "__main__":
+    main()
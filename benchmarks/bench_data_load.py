@@ -0,0 +1,83 @@
+"""Request count and wall time for the data load behind app.main(), against the local GitHub stub.
+
+Run from the repo root:  python benchmarks/bench_data_load.py
+
+Scenarios:
+  cold      every cache empty
+  warm      same process again (in-memory caches populated)
+  restart   in-memory caches dropped, on-disk HTTP cache kept (conditional requests -> 304)
+  degraded  cold, 10% 5xx responses and a core budget low enough to trip the enrichment reserve
+  lang-403  cold, every /languages call answers 403
+"""
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from github_stub import GitHubStub, StubConfig  # noqa: E402
+
+LATENCY = 0.02
+
+stub = GitHubStub().start()
+os.environ["GITHUB_API_BASE"] = stub.base_url
+os.environ["GITHUB_HTTP_CACHE"] = os.path.join(tempfile.mkdtemp(), "github_http.sqlite3")
+os.environ.pop("GITHUB_TOKEN", None)
+
+import github_api  # noqa: E402
+from data import PROJECT_SHORTLIST, SHORTLIST_FALLBACKS  # noqa: E402
+
+
+def load_main_data(username: str) -> None:
+    """The GitHub calls app.main() makes on a first render with the default controls."""
+    github_api.fetch_github_summary(username)
+    repos = github_api.fetch_portfolio_repositories(username=username, topic="portfolio", backend="rest")
+    github_api.fetch_repositories(
+        username=username,
+        names=github_api.shortlist_misses(repos, PROJECT_SHORTLIST),
+        fallbacks=SHORTLIST_FALLBACKS,
+        backend="rest",
+    )
+
+
+def run(label: str, config: StubConfig, clear: str | None) -> None:
+    if clear == "all":
+        github_api.clear_caches(persistent=True)
+    elif clear == "memory":
+        github_api.clear_caches(persistent=False)
+    stub.reset(config)
+    before = github_api.http_cache_stats()
+
+    start = time.perf_counter()
+    load_main_data(config.owner)
+    elapsed = time.perf_counter() - start
+
+    after = github_api.http_cache_stats()
+    revalidated = after["revalidated"] - before["revalidated"]
+    counts = stub.counts
+    print(
+        f"{label:>9} {stub.total_requests:>9} {counts['search']:>7} {counts['repos']:>6} "
+        f"{counts['languages']:>6} {counts['users']:>6} {revalidated:>5} {elapsed:>9.2f}"
+    )
+
+
+def main() -> None:
+    # max_age=0 forces revalidation so the restart scenario shows 304s; GitHub's 60 s would skip them.
+    base = StubConfig(latency=LATENCY, max_age=0)
+    print(f"{'scenario':>9} {'requests':>9} {'search':>7} {'repos':>6} {'langs':>6} {'users':>6} {'304s':>5} {'wall (s)':>9}")
+    try:
+        run("cold", base, clear="all")
+        run("warm", base, clear=None)
+        run("restart", base, clear="memory")
+        run("degraded", StubConfig(latency=LATENCY, max_age=0, error_rate=0.1, rate_limit=60), clear="all")
+        run("lang-403", StubConfig(latency=LATENCY, max_age=0, languages_forbidden=True), clear="all")
+    finally:
+        stub.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Time to the hero, the last static section and the full page, progressive vs top-to-bottom.
+
+Run from the repo root:  python benchmarks/bench_first_paint.py
+
+Milestones are the ``render_timings`` app.main() records in session state: milliseconds from the
+start of the run until the hero markup, the contact section ("static") and the GitHub sections
+("complete") were emitted. Streamlit streams each element to the browser as soon as it is
+written, so these track what the visitor sees. Every run is cold against a slow local GitHub stub.
+"""
+from __future__ import annotations
+
+import os
+import statistics
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from github_stub import GitHubStub, StubConfig  # noqa: E402
+
+LATENCY = 0.15
+ROUNDS = 5
+
+stub = GitHubStub(StubConfig(owner="Shikher-jain", latency=LATENCY)).start()
+cache_dir = tempfile.mkdtemp()
+os.environ["GITHUB_API_BASE"] = stub.base_url
+os.environ["GITHUB_HTTP_CACHE"] = os.path.join(cache_dir, "github_http.sqlite3")
+os.environ["GITHUB_SNAPSHOT_PATH"] = os.path.join(cache_dir, "no_snapshot.json")
+os.environ.pop("GITHUB_TOKEN", None)
+
+import github_api  # noqa: E402
+from data import RENDER_CONFIG  # noqa: E402
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+
+def measure(progressive: bool) -> dict:
+    RENDER_CONFIG["progressive"] = progressive
+    samples = {"hero": [], "static": [], "complete": []}
+    for _ in range(ROUNDS):
+        github_api.clear_caches(persistent=True)
+        at = AppTest.from_file(str(ROOT / "app.py"), default_timeout=120).run()
+        if at.exception:
+            raise RuntimeError(at.exception[0].message)
+        for label, value in at.session_state["render_timings"].items():
+            samples[label].append(value)
+    return {label: statistics.median(values) for label, values in samples.items()}
+
+
+def main() -> None:
+    os.chdir(ROOT)
+    print(f"{'mode':>12} {'hero (ms)':>10} {'static (ms)':>12} {'complete (ms)':>14}")
+    try:
+        for label, progressive in (("sequential", False), ("progressive", True)):
+            result = measure(progressive)
+            print(f"{label:>12} {result['hero']:>10.1f} {result['static']:>12.1f} {result['complete']:>14.1f}")
+    finally:
+        stub.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Request count and latency for a full project load (feed + shortlist misses), REST vs GraphQL.
+
+Run from the repo root:  python benchmarks/bench_graphql_backend.py
+GitHub is simulated with a fixed per-request latency; the shortlist misses are the
+PROJECT_SHORTLIST names that the simulated topic search does not return.
+"""
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ["GITHUB_HTTP_CACHE"] = os.path.join(tempfile.mkdtemp(), "github_http.sqlite3")
+
+import github_api  # noqa: E402
+from data import PROJECT_SHORTLIST  # noqa: E402
+
+LATENCY = 0.05
+REPO_COUNT = 60
+CALLS = {"rest": 0, "graphql": 0}
+
+
+def _rest_repo(name: str) -> dict:
+    return {
+        "name": name,
+        "full_name": f"bench/{name}",
+        "languages_url": f"{github_api.API_BASE}/repos/bench/{name}/languages",
+        "topics": ["portfolio"],
+        "stargazers_count": 3,
+    }
+
+
+def _graphql_repo(name: str) -> dict:
+    return {
+        "name": name,
+        "nameWithOwner": f"bench/{name}",
+        "stargazerCount": 3,
+        "repositoryTopics": {"nodes": [{"topic": {"name": "portfolio"}}]},
+        "languages": {"nodes": [{"name": "Python"}, {"name": "Shell"}]},
+    }
+
+
+def _fake_rest(url, params=None, essential=True):
+    CALLS["rest"] += 1
+    time.sleep(LATENCY)
+    if url.endswith("/search/repositories"):
+        return {"items": [_rest_repo(f"repo-{idx}") for idx in range(params["per_page"])]}
+    if url.endswith("/languages"):
+        return {"Python": 1000, "Shell": 10}
+    return _rest_repo(url.rsplit("/", 1)[-1])
+
+
+def _fake_graphql(query, variables):
+    CALLS["graphql"] += 1
+    time.sleep(LATENCY)
+    if "search(" in query:
+        nodes = [_graphql_repo(f"repo-{idx}") for idx in range(variables["first"])]
+        return {"search": {"pageInfo": {"hasNextPage": False, "endCursor": None}, "nodes": nodes}}
+    return {
+        key.replace("n", "r", 1): _graphql_repo(value)
+        for key, value in variables.items()
+        if key != "owner"
+    }
+
+
+def _load(backend: str) -> tuple[float, int]:
+    CALLS.update(rest=0, graphql=0)
+    github_api.clear_caches()
+
+    start = time.perf_counter()
+    feed = github_api.fetch_portfolio_repositories("bench", max_items=REPO_COUNT, backend=backend)
+    known = {repo["name"].lower() for repo in feed}
+    misses = [name for name in PROJECT_SHORTLIST if name.lower() not in known]
+    github_api.fetch_repositories("bench", misses, backend=backend)
+    return time.perf_counter() - start, CALLS["rest"] + CALLS["graphql"]
+
+
+def main() -> None:
+    os.environ.setdefault("GITHUB_TOKEN", "bench-token")
+    github_api._safe_request = _fake_rest
+    github_api._graphql_request = _fake_graphql
+
+    print(f"{'backend':>8} {'requests':>9} {'wall (s)':>9}")
+    for backend in ("rest", "graphql"):
+        elapsed, requests_made = _load(backend)
+        print(f"{backend:>8} {requests_made:>9} {elapsed:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Admin inbox page latency by depth, OFFSET pagination vs the keyset pages fetch_inbox_page reads.
+
+Run from the repo root against a throwaway local Postgres configured in .streamlit/secrets.toml
+(see bench_contact_db.py):
+
+    python benchmarks/bench_inbox_pagination.py
+
+Seeds ``ROWS`` messages into ``contact_form`` (deleted afterwards), then times the page at several
+depths both ways. "offset" is ``ORDER BY ... OFFSET n LIMIT 25``, which reads and discards every
+row before the page; "keyset" seeks straight to it through the (created_at, id) index.
+"""
+from __future__ import annotations
+
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import contact_store  # noqa: E402
+
+ROWS = 200_000
+MARKER = "bench_inbox_pagination"
+DEPTHS = (0, 1_000, 10_000, 100_000, 190_000)
+REPEATS = 5
+
+
+def seed() -> None:
+    with contact_store.connection() as conn, conn.cursor() as cursor:
+        cursor.execute(
+            "INSERT INTO contact_form (name, email, message, created_at) "
+            "SELECT %s, 'user' || n || '@example.com', 'hello', now() - n * interval '1 minute' "
+            "FROM generate_series(1, %s) AS n",
+            (MARKER, ROWS),
+        )
+        cursor.execute("ANALYZE contact_form")
+
+
+def offset_page(depth: int) -> float:
+    start = time.perf_counter()
+    with contact_store.connection() as conn, conn.cursor() as cursor:
+        cursor.execute(
+            "SELECT id, created_at, name, email, message FROM contact_form "
+            "ORDER BY created_at DESC, id DESC OFFSET %s LIMIT %s",
+            (depth, contact_store.INBOX_PAGE_SIZE),
+        )
+        cursor.fetchall()
+    return time.perf_counter() - start
+
+
+def keyset_cursor(depth: int) -> contact_store.InboxCursor | None:
+    """The cursor a user would hold after paging down to ``depth`` (looked up, not timed)."""
+    if depth == 0:
+        return None
+    with contact_store.connection() as conn, conn.cursor() as cursor:
+        cursor.execute(
+            "SELECT created_at, id FROM contact_form ORDER BY created_at DESC, id DESC OFFSET %s LIMIT 1",
+            (depth - 1,),
+        )
+        return cursor.fetchone()
+
+
+def keyset_page(after: contact_store.InboxCursor | None) -> float:
+    start = time.perf_counter()
+    contact_store.fetch_inbox_page(after)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    contact_store.ensure_schema()
+    seed()
+    try:
+        print(f"{'depth':>8} {'offset (ms)':>12} {'keyset (ms)':>12}")
+        for depth in DEPTHS:
+            after = keyset_cursor(depth)
+            old = statistics.median(offset_page(depth) for _ in range(REPEATS))
+            new = statistics.median(keyset_page(after) for _ in range(REPEATS))
+            print(f"{depth:>8} {old * 1000:>12.2f} {new * 1000:>12.2f}")
+        start = time.perf_counter()
+        contact_store.fetch_inbox_page(search="user19999")
+        print(f"prefix search on email: {(time.perf_counter() - start) * 1000:.2f} ms")
+    finally:
+        with contact_store.connection() as conn, conn.cursor() as cursor:
+            cursor.execute("DELETE FROM contact_form WHERE name = %s", (MARKER,))
+        contact_store.close_pool()
+
+
+if __name__ == "__main__":
+    main()
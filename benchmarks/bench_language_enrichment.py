@@ -0,0 +1,58 @@
+"""Cold-fetch wall time for fetch_portfolio_repositories, serial vs pooled language enrichment.
+
+Run from the repo root:  python benchmarks/bench_language_enrichment.py
+GitHub is simulated with a fixed per-request latency so the numbers are repeatable offline.
+"""
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ["GITHUB_HTTP_CACHE"] = os.path.join(tempfile.mkdtemp(), "github_http.sqlite3")
+
+import github_api  # noqa: E402
+
+LATENCY = 0.05
+REPO_COUNT = 60
+
+
+def _fake_request(url, params=None, essential=True):
+    time.sleep(LATENCY)
+    if url.endswith("/search/repositories"):
+        items = [
+            {
+                "name": f"repo-{idx}",
+                "full_name": f"bench/repo-{idx}",
+                "languages_url": f"{github_api.API_BASE}/repos/bench/repo-{idx}/languages",
+                "topics": ["portfolio"],
+            }
+            for idx in range(params["per_page"])
+        ]
+        return {"items": items}
+    return {"Python": 1000, "Jupyter Notebook": 400, "Shell": 10}
+
+
+def _cold_fetch(max_workers: int) -> tuple[float, list]:
+    github_api.clear_caches()
+    start = time.perf_counter()
+    repos = github_api.fetch_portfolio_repositories("bench", max_items=REPO_COUNT, max_workers=max_workers)
+    return time.perf_counter() - start, repos
+
+
+def main() -> None:
+    github_api._safe_request = _fake_request
+    serial_time, serial_repos = _cold_fetch(max_workers=1)
+    print(f"{'workers':>8} {'wall (s)':>10} {'speedup':>8}")
+    print(f"{1:>8} {serial_time:>10.2f} {1.0:>8.1f}")
+    for workers in (4, 8, 16):
+        elapsed, repos = _cold_fetch(max_workers=workers)
+        assert [r["name"] for r in repos] == [r["name"] for r in serial_repos], "order changed"
+        print(f"{workers:>8} {elapsed:>10.2f} {serial_time / elapsed:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Script time per interaction: full app.main() rerun vs the fragment that now owns the widget.
+
+Run from the repo root:  python benchmarks/bench_partial_reruns.py
+
+AppTest always reruns the whole script, so each interaction is measured twice inside a script run:
+once around ``app.main()`` (what every click cost before) and once around only the fragment body,
+which is all Streamlit executes on a fragment rerun. GitHub calls go to the local stub.
+"""
+from __future__ import annotations
+
+import os
+import statistics
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from github_stub import GitHubStub, StubConfig  # noqa: E402
+
+stub = GitHubStub(StubConfig(owner="Shikher-jain", repo_count=12)).start()
+os.environ["GITHUB_API_BASE"] = stub.base_url
+os.environ["GITHUB_HTTP_CACHE"] = os.path.join(tempfile.mkdtemp(), "github_http.sqlite3")
+os.environ.pop("GITHUB_TOKEN", None)
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+ROUNDS = 15
+
+
+def _timed_script(target: str) -> None:
+    # Runs as the AppTest script; imports live inside so AppTest can extract the source.
+    import time
+
+    import streamlit as st
+
+    import app
+    from components.github_stats import _render_spotlight
+    from data import GITHUB_CONFIG
+
+    if target == "full":
+        start = time.perf_counter()
+        app.main()
+    else:
+        repos = app._load_github_repos(GITHUB_CONFIG["username"], GITHUB_CONFIG["topic"])
+        fragments = {
+            "ml-lab": app._render_ml_lab,
+            "projects": lambda: app._render_projects(GITHUB_CONFIG["username"], GITHUB_CONFIG["topic"], repos),
+            "skills": app._render_skills_section,
+            "spotlight": lambda: _render_spotlight(repos),
+        }
+        start = time.perf_counter()
+        fragments[target]()
+    st.session_state["bench_seconds"] = time.perf_counter() - start
+
+
+def _interact(at: AppTest, interaction: str, step: int) -> None:
+    if interaction == "ml-lab":
+        at.button(key="sentiment-btn").click()
+    elif interaction == "projects":
+        at.toggle(key="live-only-toggle").set_value(step % 2 == 0)
+    elif interaction == "skills":
+        box = at.selectbox(key="skills-filter")
+        box.set_value(box.options[step % len(box.options)])
+    elif interaction == "spotlight":
+        box = at.selectbox(key="github-spotlight")
+        box.set_value(box.options[step % len(box.options)])
+
+
+def measure(interaction: str, target: str) -> float:
+    at = AppTest.from_function(_timed_script, args=(target,), default_timeout=120)
+    at.run()
+    samples = []
+    for step in range(1, ROUNDS + 1):
+        _interact(at, interaction, step)
+        at.run()
+        if at.exception:
+            raise RuntimeError(at.exception[0].message)
+        samples.append(at.session_state["bench_seconds"])
+    return statistics.median(samples)
+
+
+def main() -> None:
+    os.chdir(ROOT)
+    print(f"{'interaction':>12} {'full (ms)':>10} {'fragment (ms)':>14} {'speedup':>8}")
+    try:
+        for interaction in ("ml-lab", "projects", "skills", "spotlight"):
+            full = measure(interaction, "full")
+            fragment = measure(interaction, interaction)
+            print(f"{interaction:>12} {full * 1000:>10.1f} {fragment * 1000:>14.1f} {full / fragment:>7.1f}x")
+    finally:
+        stub.stop()
+
+
+if __name__ == "__main__":
+    main()
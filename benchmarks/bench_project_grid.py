@@ -0,0 +1,73 @@
+"""Project-grid payload and build time as the repository feed grows.
+
+Run from the repo root:  python benchmarks/bench_project_grid.py
+
+"all cards" is the markup the grid sent before pagination (every card in one blob); "first page"
+is what render_project_cards sends now, measured through AppTest on a cold card cache.
+"""
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+from components.flip_card import _cached_card, card_html  # noqa: E402
+
+
+def _repos(count: int) -> list:
+    return [
+        {
+            "name": f"repo-{idx}",
+            "full_name": f"bench/repo-{idx}",
+            "description": "Benchmark fixture with a description long enough to be shortened on both faces. " * 3,
+            "languages": ["Python", "Jupyter Notebook", "Shell"],
+            "topics": ["portfolio", "ml", "computer-vision"],
+            "category": "Applied AI",
+            "stars": idx % 17,
+            "forks": idx % 5,
+            "html_url": f"https://github.com/bench/repo-{idx}",
+            "homepage": "",
+            "pushed_at": f"2026-01-{idx % 28 + 1:02d}T09:30:00Z",
+        }
+        for idx in range(count)
+    ]
+
+
+def _grid_script(repos: list) -> None:
+    import time
+
+    import streamlit as st
+
+    from components.flip_card import render_project_cards
+
+    start = time.perf_counter()
+    render_project_cards(repos)
+    st.session_state["bench_seconds"] = time.perf_counter() - start
+
+
+def main() -> None:
+    # Warm-up run so the first row does not pay for Streamlit's imports.
+    AppTest.from_function(_grid_script, args=(_repos(1),), default_timeout=60).run()
+    print(f"{'repos':>6} {'all cards (KB)':>15} {'all (ms)':>9} {'first page (KB)':>16} {'page (ms)':>10}")
+    for count in (12, 60, 200, 1000):
+        _cached_card.cache_clear()
+        start = time.perf_counter()
+        all_bytes = len("".join(card_html(repo) for repo in _repos(count)).encode("utf-8"))
+        all_seconds = time.perf_counter() - start
+
+        _cached_card.cache_clear()
+        at = AppTest.from_function(_grid_script, args=(_repos(count),), default_timeout=60).run()
+        page_bytes = sum(len(block.value.encode("utf-8")) for block in at.markdown)
+        page_seconds = at.session_state["bench_seconds"]
+        print(
+            f"{count:>6} {all_bytes / 1024:>15.1f} {all_seconds * 1000:>9.1f} "
+            f"{page_bytes / 1024:>16.1f} {page_seconds * 1000:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Per-call latency against a local stub: fresh connection per call vs the pooled github_api session.
+
+Run from the repo root:  python benchmarks/bench_session_pooling.py
+Loopback has no TLS, so real-world savings against api.github.com are larger than shown here.
+"""
+from __future__ import annotations
+
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import requests  # noqa: E402
+
+import github_api  # noqa: E402
+from github_stub import GitHubStub  # noqa: E402
+
+CALLS = 300
+
+
+def _measure(call) -> list[float]:
+    timings = []
+    for _ in range(CALLS):
+        start = time.perf_counter()
+        call()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main() -> None:
+    stub = GitHubStub().start()
+    url = f"{stub.base_url}/users/bench"
+    try:
+        unpooled = _measure(lambda: requests.get(url, headers={"Connection": "close"}, timeout=5).json())
+        pooled = _measure(lambda: github_api._send("GET", url).json())
+    finally:
+        stub.stop()
+
+    print(f"{'transport':>10} {'p50 (ms)':>9} {'p95 (ms)':>9} {'total (s)':>10}")
+    for label, timings in (("fresh", unpooled), ("pooled", pooled)):
+        p95 = statistics.quantiles(timings, n=20)[-1]
+        print(f"{label:>10} {statistics.median(timings):>9.2f} {p95:>9.2f} {sum(timings) / 1000:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Markup work per "Filter skill category" change, rebuilt per interaction vs the skills index.
+
+Run from the repo root:  python benchmarks/bench_skills_filter.py
+
+"before" rebuilds the selected groups' flip cards on every change, as render_skills used to;
+"after" is the lookup render_skills does now (serializing SKILL_GROUPS for the key included).
+"""
+from __future__ import annotations
+
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from components.skills import _skill_card_html, skills_index  # noqa: E402
+from data import SKILL_GROUPS  # noqa: E402
+
+ROUNDS = 500
+
+
+def before(choice: str) -> str:
+    groups = SKILL_GROUPS if choice == "All" else [g for g in SKILL_GROUPS if g.get("category") == choice]
+    return f"<div class='skill-grid'>{''.join(_skill_card_html(group) for group in groups)}</div>"
+
+
+def after(choice: str) -> str:
+    index = skills_index(SKILL_GROUPS)
+    cards = index.values() if choice == "All" else [index[choice]]
+    return f"<div class='skill-grid'>{''.join(cards)}</div>"
+
+
+def main() -> None:
+    skills_index(SKILL_GROUPS)
+    print(f"{'filter':>40} {'before (us)':>12} {'after (us)':>11}")
+    for choice in ["All"] + [group["category"] for group in SKILL_GROUPS]:
+        old = timeit.timeit(lambda: before(choice), number=ROUNDS) / ROUNDS
+        new = timeit.timeit(lambda: after(choice), number=ROUNDS) / ROUNDS
+        print(f"{choice:>40} {old * 1e6:>12.1f} {new * 1e6:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""Local stand-in for api.github.com used by the benchmarks.
+
+Serves the REST endpoints github_api.py calls: topic search (paginated), single repositories,
+``/languages`` and ``/users``. Responses carry ETags and ``X-RateLimit-*`` headers, and the
+config can inject latency, 5xx errors and 403s on language lookups. Point the data layer at it
+with ``GITHUB_API_BASE=<stub.base_url>`` before importing ``github_api``.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Tuple
+from urllib.parse import parse_qs, urlparse
+
+_REPO_RE = re.compile(r"^/repos/(?P<owner>[^/]+)/(?P<name>[^/]+)(?P<languages>/languages)?$")
+_USER_RE = re.compile(r"^/users/(?P<login>[^/]+)$")
+
+
+@dataclass
+class StubConfig:
+    owner: str = "bench"
+    topic: str = "portfolio"
+    repo_count: int = 60
+    # Names that /repos/{owner}/{name} answers with 404.
+    missing: List[str] = field(default_factory=list)
+    latency: float = 0.0
+    error_rate: float = 0.0
+    languages_forbidden: bool = False
+    rate_limit: int = 5000
+    search_rate_limit: int = 30
+    max_age: int = 60
+    seed: int = 7
+
+
+class GitHubStub:
+    """Threaded HTTP server with per-endpoint request counters."""
+
+    def __init__(self, config: StubConfig | None = None) -> None:
+        self.config = config or StubConfig()
+        self.counts: Counter = Counter()
+        self._lock = threading.Lock()
+        self._random = random.Random(self.config.seed)
+        self._remaining: Dict[str, int] = {}
+        self._reset_at = 0
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self.reset()
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    def start(self) -> "GitHubStub":
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def reset(self, config: StubConfig | None = None) -> None:
+        """Swap in a new config, zero the counters and refill the rate-limit budgets."""
+        with self._lock:
+            if config is not None:
+                self.config = config
+            self.counts.clear()
+            self._random = random.Random(self.config.seed)
+            self._remaining = {"core": self.config.rate_limit, "search": self.config.search_rate_limit}
+            self._reset_at = int(time.time()) + 3600
+
+    @property
+    def total_requests(self) -> int:
+        return sum(self.counts.values())
+
+    def _repo(self, name: str) -> Dict:
+        owner = self.config.owner
+        return {
+            "name": name,
+            "full_name": f"{owner}/{name}",
+            "description": f"Benchmark fixture for {name}.",
+            "html_url": f"https://github.com/{owner}/{name}",
+            "homepage": "",
+            "languages_url": f"{self.base_url}/repos/{owner}/{name}/languages",
+            "stargazers_count": len(name),
+            "forks_count": 1,
+            "topics": [self.config.topic, "ml"],
+            "default_branch": "main",
+            "pushed_at": "2026-01-15T09:30:00Z",
+        }
+
+    def route(self, path: str, query: Dict[str, List[str]]) -> Tuple[str, str, int, Dict | None]:
+        """Return (counter kind, rate-limit resource, status, payload) for a GET."""
+        if path == "/search/repositories":
+            per_page = int(query.get("per_page", ["30"])[0])
+            page = int(query.get("page", ["1"])[0])
+            names = [f"repo-{idx}" for idx in range(self.config.repo_count)]
+            window = names[(page - 1) * per_page : page * per_page]
+            payload = {"total_count": len(names), "items": [self._repo(name) for name in window]}
+            return "search", "search", 200, payload
+
+        match = _REPO_RE.match(path)
+        if match and match["languages"]:
+            if self.config.languages_forbidden:
+                return "languages", "core", 403, {"message": "Resource not accessible"}
+            return "languages", "core", 200, {"Python": 9000, "Jupyter Notebook": 1200, "Shell": 40}
+        if match:
+            if match["name"] in self.config.missing:
+                return "repos", "core", 404, {"message": "Not Found"}
+            return "repos", "core", 200, self._repo(match["name"])
+
+        match = _USER_RE.match(path)
+        if match:
+            payload = {
+                "login": match["login"],
+                "followers": 42,
+                "following": 7,
+                "public_repos": self.config.repo_count,
+                "html_url": f"https://github.com/{match['login']}",
+                "avatar_url": f"https://avatars.example/{match['login']}.png",
+            }
+            return "users", "core", 200, payload
+
+        return "other", "core", 404, {"message": "Not Found"}
+
+    def _handler_class(self):
+        stub = self
+
+        class _StubHandler(BaseHTTPRequestHandler):
+            # HTTP/1.1 so clients can keep connections alive between calls.
+            protocol_version = "HTTP/1.1"
+            # Headers and body go out in separate writes; without this, delayed ACKs add ~40 ms per call.
+            disable_nagle_algorithm = True
+
+            def do_GET(self) -> None:
+                parsed = urlparse(self.path)
+                config = stub.config
+                if config.latency:
+                    time.sleep(config.latency)
+
+                kind, resource, status, payload = stub.route(parsed.path, parse_qs(parsed.query))
+                body = json.dumps(payload).encode("utf-8")
+                etag = f'"{hashlib.sha1(body).hexdigest()}"'
+
+                with stub._lock:
+                    stub.counts[kind] += 1
+                    if status == 200 and config.error_rate and stub._random.random() < config.error_rate:
+                        status, body = 502, b'{"message": "Server Error"}'
+                    not_modified = status == 200 and self.headers.get("If-None-Match") == etag
+                    # Like GitHub, conditional hits do not spend budget.
+                    if not not_modified:
+                        if stub._remaining[resource] <= 0:
+                            status, body = 403, b'{"message": "API rate limit exceeded"}'
+                        else:
+                            stub._remaining[resource] -= 1
+                    remaining = stub._remaining[resource]
+                    limit = config.search_rate_limit if resource == "search" else config.rate_limit
+
+                self.send_response(304 if not_modified else status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("ETag", etag)
+                self.send_header("Cache-Control", f"private, max-age={config.max_age}")
+                self.send_header("X-RateLimit-Limit", str(limit))
+                self.send_header("X-RateLimit-Remaining", str(remaining))
+                self.send_header("X-RateLimit-Reset", str(stub._reset_at))
+                self.send_header("X-RateLimit-Resource", resource)
+                self.send_header("Content-Length", "0" if not_modified else str(len(body)))
+                self.end_headers()
+                if not not_modified:
+                    self.wfile.write(body)
+
+            def log_message(self, format: str, *args) -> None:  # noqa: A002 - silence per-request logging
+                pass
+
+        return _StubHandler
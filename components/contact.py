@@ -4,12 +4,14 @@ from __future__ import annotations
 import html
 from typing import Dict
 import streamlit as st
+from .icon_sprite import icon_html
 from .social_icons import get_social_icon_url
-import psycopg2
 from dotenv import load_dotenv
-import os
 import logging
 
+from contact_guard import ADMITTED, DUPLICATE, admit_submission, release_submission
+from contact_store import enqueue_message, start_replay
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -18,8 +20,7 @@ logging.basicConfig(level=logging.ERROR, format='%(asctime)s - %(levelname)s - %
 
 
 def _social_icon_html(label: str) -> str:
-    icon_url = get_social_icon_url(label)
-    return f"<span class='social-icon'><img src='{icon_url}' alt='{label} icon' loading='lazy' /></span>"
+    return f"<span class='social-icon'>{icon_html(get_social_icon_url(label), f'{label} icon')}</span>"
 
 
 def render_contact_section(contact: dict[str, str]) -> None:
@@ -75,6 +76,8 @@ def render_contact_section(contact: dict[str, str]) -> None:
 
     st.markdown("<hr/>", unsafe_allow_html=True)
 
+    # Deliver any messages a previous run left in the outbox
+    start_replay()
     with st.form("contact-form", clear_on_submit=True):
         st.write("### Contact Form")
         name = st.text_input("Name")
@@ -85,54 +88,16 @@ def render_contact_section(contact: dict[str, str]) -> None:
             if not (name and email and message):
                 st.error("Please complete all fields before sending.")
             else:
-                # Insert data into the PostgreSQL database
-                conn = get_db_connection()
-                if conn:
-                    cursor = conn.cursor()
-                    cursor.execute(
-                        "INSERT INTO contact_form (name, email, message) VALUES (%s, %s, %s)",
-                        (name, email, message)
-                    )
-                    conn.commit()
-                    conn.close()
-
+                # Rate limits and duplicate suppression run before anything is stored
+                verdict = admit_submission(email, message)
+                if verdict == DUPLICATE:
+                    st.info("This message was already received - no need to send it again.")
+                elif verdict != ADMITTED:
+                    st.warning("Too many messages from this connection. Please try again in a minute.")
+                # Save the message locally; a background replayer delivers it to PostgreSQL
+                elif enqueue_message(name, email, message):
                     st.success("Thanks for reaching out! I will reply within 2 business days.")
-
-# Establish a connection to the PostgreSQL database with error handling
-def get_db_connection():
-    try:
-        return psycopg2.connect(
-            host=st.secrets['DB']["DB_HOST"],
-        database=st.secrets['DB']["DB_NAME"],
-        user=st.secrets['DB']["DB_USER"],
-        password=st.secrets['DB']["DB_PASSWORD"],
-        port=st.secrets['DB']["DB_PORT"],
-        sslmode="require"
-    )
-
-    except psycopg2.Error as err:
-        logging.error(f"Database connection failed: {err}")
-        st.error("Unable to connect to the database. Please try again later.")
-        return None
-
-# Ensure the table exists with error handling
-try:
-    conn = get_db_connection()
-    if conn:
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS contact_form (
-                id SERIAL PRIMARY KEY,
-                name VARCHAR(255) NOT NULL,
-                email VARCHAR(255) NOT NULL,
-                message TEXT NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-            """
-        )
-        conn.commit()
-        conn.close()
-except psycopg2.Error as err:
-    logging.error(f"Failed to ensure table exists: {err}")
-    st.error("Database setup failed. Please contact support.")
+                else:
+                    release_submission(email, message)
+                    logging.error("Contact message could not be stored in the outbox")
+                    st.error("Your message could not be saved. Please try again or email me directly.")
@@ -0,0 +1,187 @@
+"""Minified, pruned stylesheet served as one content-hashed static file.
+
+``styles/style.css`` is the source of truth. The bundle drops comments and whitespace, removes
+selectors whose classes no template in ``app.py``/``components/`` mentions, and is published to
+``static/css/``, so each rerun sends a short ``<link>`` instead of the whole stylesheet and the
+browser downloads it once. Run ``python -m components.css_bundle`` for a size and timing report.
+"""
+from __future__ import annotations
+
+import re
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Set, Tuple
+
+from .static_files import publish_bytes
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+STYLESHEET = ROOT_DIR / "styles" / "style.css"
+# Everything that emits markup; a class is "used" if its name appears anywhere in these files.
+TEMPLATE_SOURCES = [ROOT_DIR / "app.py", ROOT_DIR / "data.py", *sorted((ROOT_DIR / "components").glob("*.py"))]
+
+_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_IMPORT_RE = re.compile(r"@import\s+url\([^)]*\)[^;]*;")
+_CLASS_RE = re.compile(r"\.(-?[_a-zA-Z][\w-]*)")
+_WORD_RE = re.compile(r"[\w-]+")
+# Streamlit's own widget classes (stApp, stButton, ...) never appear in our templates.
+_STREAMLIT_CLASS_RE = re.compile(r"st[A-Z]")
+# Only these at-rules wrap style rules that can be pruned; keyframes and the like are kept whole.
+_PRUNABLE_AT_RULES = ("@media", "@supports")
+
+
+def _parse(css: str) -> List[Tuple[str, str]]:
+    """Split a comment-free stylesheet into top-level ``(prelude, body)`` pairs."""
+    rules: List[Tuple[str, str]] = []
+    pos = 0
+    while True:
+        start = css.find("{", pos)
+        if start == -1:
+            return rules
+        depth, end = 1, start + 1
+        while depth:
+            if css[end] == "{":
+                depth += 1
+            elif css[end] == "}":
+                depth -= 1
+            end += 1
+        rules.append((css[pos:start].strip(), css[start + 1 : end - 1]))
+        pos = end
+
+
+def _split_selectors(prelude: str) -> List[str]:
+    selectors, depth, current = [], 0, ""
+    for char in prelude:
+        depth += char == "("
+        depth -= char == ")"
+        if char == "," and depth == 0:
+            selectors.append(current)
+            current = ""
+        else:
+            current += char
+    return [selector.strip() for selector in selectors + [current] if selector.strip()]
+
+
+def _minify_selector(selector: str) -> str:
+    selector = re.sub(r"\s+", " ", selector)
+    return re.sub(r"\s*([>+~])\s*", r"\1", selector)
+
+
+def _minify_declarations(body: str) -> str:
+    declarations = []
+    for declaration in body.split(";"):
+        prop, sep, value = declaration.partition(":")
+        if not sep:
+            continue
+        value = re.sub(r"\s+", " ", value.strip())
+        value = re.sub(r"\s*,\s*", ",", value)
+        declarations.append(f"{prop.strip()}:{value}")
+    return ";".join(declarations)
+
+
+def _is_used(selector: str, used: Set[str]) -> bool:
+    return all(name in used or _STREAMLIT_CLASS_RE.match(name) for name in _CLASS_RE.findall(selector))
+
+
+def _render(rules: List[Tuple[str, str]], used: Set[str] | None) -> str:
+    """Serialize ``rules`` minified, dropping unused selectors unless ``used`` is ``None``."""
+    output = []
+    for prelude, body in rules:
+        if prelude.startswith("@"):
+            prelude = re.sub(r"\s+", " ", prelude)
+            if "{" in body:
+                prune = used if prelude.startswith(_PRUNABLE_AT_RULES) else None
+                inner = _render(_parse(body), prune)
+                if inner:
+                    output.append(f"{prelude}{{{inner}}}")
+            else:
+                output.append(f"{prelude}{{{_minify_declarations(body)}}}")
+            continue
+
+        selectors = _split_selectors(prelude)
+        if used is not None:
+            selectors = [selector for selector in selectors if _is_used(selector, used)]
+        declarations = _minify_declarations(body)
+        if selectors and declarations:
+            output.append(f"{','.join(_minify_selector(s) for s in selectors)}{{{declarations}}}")
+    return "".join(output)
+
+
+def template_tokens() -> Set[str]:
+    tokens: Set[str] = set()
+    for path in TEMPLATE_SOURCES:
+        tokens.update(_WORD_RE.findall(path.read_text(encoding="utf-8")))
+    return tokens
+
+
+def build_css(source: str, used: Set[str] | None) -> str:
+    """Minify ``source``; with ``used`` given, also strip rules for classes outside that set."""
+    css = _COMMENT_RE.sub("", source)
+    imports = _IMPORT_RE.findall(css)
+    css = _IMPORT_RE.sub("", css)
+    return "".join(imports) + _render(_parse(css), used)
+
+
+@dataclass(frozen=True)
+class CssBundle:
+    css: str
+    # Static URL of the published file, or None when the static folder is not writable.
+    url: str | None
+    source_bytes: int
+    build_seconds: float
+
+    @property
+    def tag(self) -> str:
+        if self.url:
+            return f"<link rel='stylesheet' href='{self.url}'>"
+        return f"<style>{self.css}</style>"
+
+
+@lru_cache(maxsize=2)
+def _build_bundle(versions: Tuple[int, ...]) -> CssBundle:
+    # ``versions`` (stylesheet and template mtimes) only keys the cache.
+    start = time.perf_counter()
+    source = STYLESHEET.read_text(encoding="utf-8")
+    css = build_css(source, template_tokens())
+    url = publish_bytes(css.encode("utf-8"), STYLESHEET.stem, ".css", subdir="css")
+    return CssBundle(css, url, len(source.encode("utf-8")), time.perf_counter() - start)
+
+
+def load_bundle() -> CssBundle:
+    """The bundle for the current stylesheet and templates, rebuilt only after one of them changes."""
+    return _build_bundle(tuple(path.stat().st_mtime_ns for path in (STYLESHEET, *TEMPLATE_SOURCES)))
+
+
+def main() -> None:
+    source = STYLESHEET.read_text(encoding="utf-8")
+    minified = build_css(source, None)
+    bundle = load_bundle()
+    rows = [
+        ("source", len(source.encode("utf-8"))),
+        ("minified", len(minified.encode("utf-8"))),
+        ("minified + pruned", len(bundle.css.encode("utf-8"))),
+        ("sent per rerun (before)", len(f"<style>{source}</style>".encode("utf-8"))),
+        ("sent per rerun (after)", len(bundle.tag.encode("utf-8"))),
+    ]
+    for label, size in rows:
+        print(f"{label:>24} {size:>7,} B")
+
+    runs = 200
+    start = time.perf_counter()
+    for _ in range(runs):
+        f"<style>{STYLESHEET.read_text(encoding='utf-8')}</style>"
+    before = (time.perf_counter() - start) / runs
+    start = time.perf_counter()
+    for _ in range(runs):
+        load_bundle().tag
+    after = (time.perf_counter() - start) / runs
+    print(f"{'cold build':>24} {bundle.build_seconds * 1000:>7.2f} ms")
+    print(f"{'per rerun (before)':>24} {before * 1e6:>7.1f} us")
+    # app._load_css keeps the tag in session state, so later reruns skip even this lookup.
+    print(f"{'per session (after)':>24} {after * 1e6:>7.1f} us")
+    print(f"{'url':>24} {bundle.url or 'inline fallback'}")
+
+
+if __name__ == "__main__":
+    main()
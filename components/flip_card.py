@@ -1,16 +1,47 @@
 """3D flip-card renderer for GitHub projects."""
 from __future__ import annotations
 
+import hashlib
+import json
+import re
+from datetime import datetime
+from functools import lru_cache
 from html import escape
 from textwrap import dedent, shorten
 from typing import Dict, List
-import uuid
 
 import streamlit as st
 
+# Every field _build_card reads; cached card markup is keyed on exactly these.
+CARD_FIELDS = (
+    "name",
+    "full_name",
+    "description",
+    "languages",
+    "topics",
+    "category",
+    "stars",
+    "forks",
+    "html_url",
+    "homepage",
+)
+
+
+# Cards per "page"; two rows of the four-column desktop grid.
+PAGE_SIZE = 8
+SORT_OPTIONS = ("Featured order", "Most stars", "Recently updated")
+
+
+def _card_id(project: Dict) -> str:
+    """Stable DOM id from the repo's full name (curated entries only have a name)."""
+    identity = project.get("full_name") or project.get("name") or ""
+    slug = re.sub(r"[^a-z0-9]+", "-", identity.lower()).strip("-")[:40] or "project"
+    # The hash keeps ids unique when two names slugify the same way.
+    return f"card-{slug}-{hashlib.sha1(identity.encode('utf-8')).hexdigest()[:8]}"
+
 
 def _build_card(project: Dict) -> str:
-    card_id = f"card-{uuid.uuid4().hex}"
+    card_id = _card_id(project)
     languages = (project.get("languages") or ["Python"])[:4]
     description = project.get("description") or "Production-grade AI workflow."
     topics = (project.get("topics") or [])[:6]
@@ -64,13 +95,62 @@ def _build_card(project: Dict) -> str:
     ).strip()
 
 
+@lru_cache(maxsize=256)
+def _cached_card(card_key: str) -> str:
+    return _build_card(json.loads(card_key))
+
+
+def card_html(project: Dict) -> str:
+    """Card markup for ``project``, rebuilt only when one of its ``CARD_FIELDS`` changed."""
+    card_key = json.dumps({field: project[field] for field in CARD_FIELDS if field in project}, sort_keys=True, default=str)
+    return _cached_card(card_key)
+
+
+def _updated_key(project: Dict) -> str:
+    # GitHub repos carry an ISO ``pushed_at``; curated entries a human "14 Jan 2026" date.
+    if project.get("pushed_at"):
+        return project["pushed_at"]
+    try:
+        return datetime.strptime(project.get("updated", ""), "%d %b %Y").strftime("%Y-%m-%dT%H:%M:%SZ")
+    except ValueError:
+        return ""
+
+
+def sort_projects(projects: List[Dict], order: str) -> List[Dict]:
+    if order == "Most stars":
+        return sorted(projects, key=lambda project: project.get("stars", 0), reverse=True)
+    if order == "Recently updated":
+        return sorted(projects, key=_updated_key, reverse=True)
+    return list(projects)
+
+
+def _show_more() -> None:
+    st.session_state["project-visible"] = st.session_state.get("project-visible", PAGE_SIZE) + PAGE_SIZE
+
+
+def _visible_count(projects: List[Dict], order: str) -> int:
+    # Start over at one page whenever the feed or the sort order changes.
+    signature = [order] + [project.get("full_name") or project.get("name") for project in projects]
+    if st.session_state.get("project-signature") != signature:
+        st.session_state["project-signature"] = signature
+        st.session_state["project-visible"] = PAGE_SIZE
+    return st.session_state["project-visible"]
+
+
 def render_project_cards(projects: List[Dict]) -> None:
-    """Render the responsive grid of project cards with hover/tap flip interactions."""
+    """Render the responsive grid of project cards with hover/tap flip interactions.
+
+    Only the visible window is built and sent; "Load more" extends it by ``PAGE_SIZE`` cards.
+    """
     if not projects:
         st.info("Publish a repository with the 'portfolio' topic to see it reflected here automatically.")
         return
 
-    cards_html = "".join(_build_card(repo) for repo in projects)
+    order = st.selectbox("Sort projects", SORT_OPTIONS, key="project-sort")
+    ordered = sort_projects(projects, order)
+    visible = ordered[: _visible_count(projects, order)]
+
+    cards_html = "".join(card_html(repo) for repo in visible)
     script = dedent(
         """
         <script>
@@ -95,3 +175,6 @@ def render_project_cards(projects: List[Dict]) -> None:
         f"<div class='project-grid'>{cards_html}</div>{script}",
         unsafe_allow_html=True,
     )
+    if len(visible) < len(ordered):
+        st.caption(f"Showing {len(visible)} of {len(ordered)} projects")
+        st.button("Load more", key="project-load-more", on_click=_show_more)
@@ -0,0 +1,68 @@
+"""Process-wide cache for section markup built from constant inputs.
+
+Each section keeps its last rendered HTML under a hash of its inputs, the stylesheet and any asset
+files it references, so reruns reuse the string instead of re-templating it.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Tuple
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+STYLESHEET = ROOT_DIR / "styles" / "style.css"
+
+_lock = threading.Lock()
+_fragments: Dict[str, Tuple[str, str]] = {}
+_stats: Dict[str, Dict[str, int]] = defaultdict(lambda: {"hits": 0, "misses": 0})
+
+
+def _file_version(path_str: str) -> Tuple[str, int, int]:
+    path = Path(path_str)
+    try:
+        stat = path.stat()
+    except OSError:
+        return path_str, 0, 0
+    return path_str, stat.st_mtime_ns, stat.st_size
+
+
+def fragment_key(inputs: Any, assets: Iterable[str] = ()) -> str:
+    """Hash of the section inputs plus the stylesheet and asset versions (mtime and size)."""
+    versions = [_file_version(str(STYLESHEET))] + [_file_version(asset) for asset in assets]
+    raw = json.dumps([inputs, versions], sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def cached_fragment(section: str, inputs: Any, build: Callable[[], str], assets: Iterable[str] = ()) -> str:
+    """Return the markup for ``section``, calling ``build`` only when its key changed.
+
+    Only the latest version of each section is kept, so the cache never grows past one entry per
+    section.
+    """
+    key = fragment_key(inputs, assets)
+    with _lock:
+        cached = _fragments.get(section)
+        if cached and cached[0] == key:
+            _stats[section]["hits"] += 1
+            return cached[1]
+        _stats[section]["misses"] += 1
+
+    markup = build()
+    with _lock:
+        _fragments[section] = (key, markup)
+    return markup
+
+
+def fragment_stats() -> Dict[str, Dict[str, int]]:
+    """Hit and miss counts per section since the process started (or the last clear)."""
+    with _lock:
+        return {section: dict(counts) for section, counts in _stats.items()}
+
+
+def clear_fragments() -> None:
+    with _lock:
+        _fragments.clear()
+        _stats.clear()
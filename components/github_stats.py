@@ -13,6 +13,40 @@ def _repo_badges(repo: Dict) -> str:
     chips = "".join(f"<span class='chip'>{topic}</span>" for topic in topics)
     return badges + chips
 
+@st.fragment
+def _render_spotlight(repos: List[Dict] | None) -> None:
+    # Picking a repo only reruns this fragment, not the whole page.
+    if repos:
+        st.markdown("<div class='repo-spotlight-shell'>", unsafe_allow_html=True)
+        names = [repo.get("name", "") for repo in repos]
+        selected = st.selectbox(
+            "Repo spotlight",
+            names,
+            key="github-spotlight",
+            label_visibility="collapsed",
+        )
+        chosen = next((repo for repo in repos if repo.get("name") == selected), None)
+        if chosen:
+            st.markdown(
+                f"""
+    <div class='repo-spotlight'>
+        <div class='spotlight-header'>
+            <p class='eyebrow'>{chosen.get('category', 'Applied AI')}</p>
+            <h4>{chosen.get('name')}</h4>
+        </div>
+        <p class='card-copy'>{chosen.get('description')}</p>
+        <div class='badge-row'>{_repo_badges(chosen)}</div>
+        <div class='stats-row'>
+            <span class='stat-pill'>⭐ {chosen.get('stars', 2)}</span>
+            <span class='stat-pill'>🍴 {chosen.get('forks', 1)}</span>
+        </div>
+        <div class='card-actions'>
+            <a class='ghost-btn' href='{chosen.get('html_url')}' target='_blank' rel='noopener'>GitHub</a>
+            {f"<a class='solid-btn' href='{chosen.get('homepage')}' target='_blank' rel='noopener'>Live</a>" if chosen.get('homepage') else ''}
+        </div>
+    </div>
+""", unsafe_allow_html=True)
+
 def render_github_stats(summary: Dict, repos: List[Dict] | None = None) -> None:
 
     has_summary = bool(summary)
@@ -52,35 +86,5 @@ def render_github_stats(summary: Dict, repos: List[Dict] | None = None) -> None:
         unsafe_allow_html=True,
     )
     st.markdown("<hr/>", unsafe_allow_html=True)
-    with st.expander("Repo Spotlight"):               
-        if repos:
-            st.markdown("<div class='repo-spotlight-shell'>", unsafe_allow_html=True)
-            names = [repo.get("name", "") for repo in repos]
-            selected = st.selectbox(
-                "Repo spotlight",
-                names,
-                key="github-spotlight",
-                label_visibility="collapsed",
-            )
-            chosen = next((repo for repo in repos if repo.get("name") == selected), None)
-            if chosen:
-                st.markdown(
-                    f"""
-    <div class='repo-spotlight'>
-        <div class='spotlight-header'>
-            <p class='eyebrow'>{chosen.get('category', 'Applied AI')}</p>
-            <h4>{chosen.get('name')}</h4>
-        </div>
-        <p class='card-copy'>{chosen.get('description')}</p>
-        <div class='badge-row'>{_repo_badges(chosen)}</div>
-        <div class='stats-row'>
-            <span class='stat-pill'>⭐ {chosen.get('stars', 2)}</span>
-            <span class='stat-pill'>🍴 {chosen.get('forks', 1)}</span>
-        </div>
-        <div class='card-actions'>
-            <a class='ghost-btn' href='{chosen.get('html_url')}' target='_blank' rel='noopener'>GitHub</a>
-            {f"<a class='solid-btn' href='{chosen.get('homepage')}' target='_blank' rel='noopener'>Live</a>" if chosen.get('homepage') else ''}
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
-
+    with st.expander("Repo Spotlight"):
+        _render_spotlight(repos)
@@ -0,0 +1,153 @@
+"""Self-hosted SVG sprite for the skill and social icons.
+
+``python -m components.icon_sprite build`` downloads every icon referenced by ``SKILL_GROUPS``,
+``PROFILE["socials"]`` and ``CONTACT`` from Simple Icons once and writes them as ``<symbol>``s to
+``assets/icons/sprite.svg``; it is a deploy step, and ``python -m components.icon_sprite check``
+exits non-zero when the sprite is missing or incomplete. At runtime icons are ``<svg><use>``
+references into the published sprite, so the browser makes one same-origin request for all of them.
+Icons missing from the sprite fall back to the CDN ``<img>``, and a missing sprite is logged.
+"""
+from __future__ import annotations
+
+import argparse
+import html
+import logging
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Tuple
+from urllib.parse import urlparse
+
+from .static_files import publish_file, write_atomic
+
+logger = logging.getLogger(__name__)
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+SPRITE_PATH = ROOT_DIR / "assets" / "icons" / "sprite.svg"
+SIMPLE_ICONS_HOST = "cdn.simpleicons.org"
+
+_SVG_RE = re.compile(r"<svg\b([^>]*)>(.*)</svg>", re.S)
+_ATTR_RE = re.compile(r'(\w+)="([^"]*)"')
+_SYMBOL_ID_RE = re.compile(r'<symbol id="([^"]+)"')
+
+
+def icon_id(cdn_url: str) -> str | None:
+    """Sprite symbol id for a ``cdn.simpleicons.org/<slug>[/<color>]`` URL, or ``None`` for other hosts."""
+    parsed = urlparse(cdn_url)
+    if parsed.netloc != SIMPLE_ICONS_HOST:
+        return None
+    # The color is part of the id: GitHub is dark among the skills but white among the socials.
+    return "icon-" + "-".join(part.lower() for part in parsed.path.strip("/").split("/") if part)
+
+
+def referenced_icons() -> Dict[str, str]:
+    """Every icon the page can render, as ``{symbol id: CDN URL}``."""
+    from data import CONTACT, PROFILE, SKILL_GROUPS
+
+    from .skills import DEFAULT_SKILL_ICON, SKILL_ICON_MAP
+    from .social_icons import DEFAULT_ICON_URL, get_social_icon_url
+
+    urls = [
+        f"https://{SIMPLE_ICONS_HOST}/{SKILL_ICON_MAP.get(item.get('name'), DEFAULT_SKILL_ICON)}"
+        for group in SKILL_GROUPS
+        for item in group.get("skills", [])
+    ] + [f"https://{SIMPLE_ICONS_HOST}/{DEFAULT_SKILL_ICON}"]
+    labels = list(PROFILE.get("socials", {})) + list(CONTACT.get("socials", {}))
+    urls += [get_social_icon_url(label) for label in labels] + [DEFAULT_ICON_URL]
+    return {icon_id(url): url for url in urls if icon_id(url)}
+
+
+def _symbol(symbol_id: str, svg: str) -> str:
+    match = _SVG_RE.search(svg)
+    if not match:
+        raise ValueError("not an SVG document")
+    attrs = dict(_ATTR_RE.findall(match.group(1)))
+    body = match.group(2).strip()
+    if attrs.get("fill"):
+        # Colored CDN icons set fill on the root element, which <symbol> would not carry over.
+        body = f'<g fill="{attrs["fill"]}">{body}</g>'
+    return f'<symbol id="{symbol_id}" viewBox="{attrs.get("viewBox", "0 0 24 24")}">{body}</symbol>'
+
+
+def build_sprite(path: Path = SPRITE_PATH, timeout: float = 10) -> Tuple[int, List[str]]:
+    """Download the referenced icons into one sprite; returns (symbols written, URLs that failed)."""
+    import requests
+
+    symbols, failed = [], []
+    with requests.Session() as session:
+        for symbol_id, url in sorted(referenced_icons().items()):
+            try:
+                response = session.get(url, timeout=timeout)
+                response.raise_for_status()
+                symbols.append(_symbol(symbol_id, response.text))
+            except (requests.RequestException, ValueError):
+                failed.append(url)
+
+    if not symbols:
+        # Offline: keep whatever sprite is already there rather than replacing it with an empty one.
+        return 0, failed
+    sprite = f'<svg xmlns="http://www.w3.org/2000/svg">{"".join(symbols)}</svg>\n'
+    write_atomic(path, lambda tmp_path: tmp_path.write_text(sprite, encoding="utf-8"))
+    return len(symbols), failed
+
+
+def sprite_version() -> int:
+    """Modification time of the sprite (0 before it is built), for caches of icon markup."""
+    try:
+        return SPRITE_PATH.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+@lru_cache(maxsize=2)
+def _sprite(version: int) -> Tuple[str | None, FrozenSet[str]]:
+    if not version:
+        logger.warning(
+            "%s has not been built; icons load from the CDN. Run python -m components.icon_sprite build",
+            SPRITE_PATH.relative_to(ROOT_DIR),
+        )
+        return None, frozenset()
+    symbols = frozenset(_SYMBOL_ID_RE.findall(SPRITE_PATH.read_text(encoding="utf-8")))
+    return publish_file(str(SPRITE_PATH), subdir="icons"), symbols
+
+
+def missing_icons() -> List[str]:
+    """CDN URLs of referenced icons that the current sprite does not contain."""
+    _, symbols = _sprite(sprite_version())
+    return [url for symbol_id, url in sorted(referenced_icons().items()) if symbol_id not in symbols]
+
+
+def icon_html(cdn_url: str, alt: str, css_class: str = "") -> str:
+    """``<svg><use>`` into the local sprite, or the CDN ``<img>`` when the icon is not in it."""
+    url, symbols = _sprite(sprite_version())
+    symbol_id = icon_id(cdn_url)
+    class_attr = f" class='{css_class}'" if css_class else ""
+    alt = html.escape(alt)
+    if url and symbol_id in symbols:
+        return f"<svg{class_attr} role='img' aria-label='{alt}'><use href='{url}#{symbol_id}'/></svg>"
+    return f"<img src='{html.escape(cdn_url)}' alt='{alt}'{class_attr} loading='lazy' decoding='async'/>"
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("command", choices=["build", "check"])
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        written, failed = build_sprite()
+        if written:
+            print(f"{SPRITE_PATH.relative_to(ROOT_DIR)}: {written} icons, {SPRITE_PATH.stat().st_size // 1024} KB")
+        _sprite.cache_clear()
+        for url in failed:
+            print(f"  failed: {url}")
+    missing = missing_icons()
+    if missing:
+        raise SystemExit(
+            f"{SPRITE_PATH.relative_to(ROOT_DIR)} is missing {len(missing)} icon(s); they would load from the CDN:\n  "
+            + "\n  ".join(missing)
+        )
+    print(f"{SPRITE_PATH.relative_to(ROOT_DIR)} has all {len(referenced_icons())} referenced icons")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""Responsive, content-hashed image variants served from Streamlit's static route.
+
+Variants are written to ``static/img/`` (served at ``app/static/img/`` once
+``server.enableStaticServing`` is on) the first time an image is rendered, or ahead of time with
+``python -m components.images``. Tiny images, missing Pillow or a read-only static folder fall back
+to inline data URIs.
+"""
+from __future__ import annotations
+
+import base64
+import mimetypes
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+try:
+    from PIL import Image, features
+except ImportError:  # pragma: no cover - Pillow is optional at runtime
+    Image = None
+    features = None
+
+from .static_files import STATIC_ROOT, STATIC_URL_ROOT, content_hash, write_atomic
+
+# Older Pythons do not know AVIF, and Streamlit's static route sends nosniff with the guessed type.
+mimetypes.add_type("image/avif", ".avif")
+
+STATIC_DIR = STATIC_ROOT / "img"
+STATIC_URL_PREFIX = f"{STATIC_URL_ROOT}/img"
+# Below this size a data URI is cheaper than an extra request.
+TINY_IMAGE_BYTES = 4 * 1024
+
+# (format name, file extension, save options), best compression first. Encoder speeds are picked so
+# a first-use build stays around a second.
+_MODERN_FORMATS = [
+    ("avif", "avif", {"quality": 55, "speed": 8}),
+    ("webp", "webp", {"quality": 80, "method": 4}),
+]
+# Universal fallback for the plain <img>: JPEG for opaque photos, PNG when transparency matters.
+_FALLBACK_FORMATS = {
+    False: ("jpeg", "jpg", {"quality": 82, "progressive": True}),
+    True: ("png", "png", {}),
+}
+
+# Rendered sizes per asset: CSS widths at 1x, 2x and 3x plus the matching ``sizes`` attribute.
+IMAGE_PROFILES = {
+    "avatar": {"widths": (160, 320, 480, 660), "sizes": "(max-width: 768px) 220px, 160px"},
+    "logo": {"widths": (150, 300, 450), "sizes": "150px"},
+}
+
+
+def image_data_uri(path_str: str) -> str:
+    # Convert image file to a data URI for embedding in HTML.
+    path = Path(path_str)
+    if path.exists():
+        mime_type = "image/png" if path.suffix.lower() == ".png" else "image/jpeg"
+        with path.open("rb") as image_file:
+            base64_data = base64.b64encode(image_file.read()).decode("utf-8")
+        return f"data:{mime_type};base64,{base64_data}"
+    return path_str
+
+
+def _formats_for(image) -> List[Tuple[str, str, Dict]]:
+    has_alpha = image.mode in ("RGBA", "LA", "PA") or "transparency" in image.info
+    modern = [fmt for fmt in _MODERN_FORMATS if features.check(fmt[0])]
+    return modern + [_FALLBACK_FORMATS[has_alpha]]
+
+
+Variants = Dict[str, List[Tuple[int, str]]]
+
+
+@lru_cache(maxsize=32)
+def _build_variants(path_str: str, mtime_ns: int, widths: Tuple[int, ...]) -> Variants:
+    """Write every (format, width) variant once and return ``{format: [(width, url), ...]}``.
+
+    The fallback format is always the last key. ``mtime_ns`` is only part of the cache key, so
+    editing the source image rebuilds its variants.
+    """
+    source = Path(path_str)
+    digest = content_hash(source)
+
+    variants: Variants = {}
+    with Image.open(source) as original:
+        original.load()
+        # Never upscale; the source width itself is the largest useful variant.
+        targets = sorted({min(width, original.width) for width in widths})
+        for fmt, ext, options in _formats_for(original):
+            for width in targets:
+                name = f"{source.stem}-{digest}-{width}w.{ext}"
+                target = STATIC_DIR / name
+                if not target.exists():
+                    height = round(original.height * width / original.width)
+                    resized = original.resize((width, height), Image.LANCZOS)
+                    if fmt == "jpeg" and resized.mode != "RGB":
+                        resized = resized.convert("RGB")
+                    write_atomic(
+                        target, lambda tmp_path: resized.save(tmp_path, format=fmt.upper(), **options)
+                    )
+                variants.setdefault(fmt, []).append((width, f"{STATIC_URL_PREFIX}/{name}"))
+    return variants
+
+
+def get_variants(path_str: str, widths: Tuple[int, ...]) -> Variants | None:
+    """Variants for ``path_str``, or ``None`` when the inline data-URI fallback should be used."""
+    path = Path(path_str)
+    if Image is None or not path.exists() or path.stat().st_size <= TINY_IMAGE_BYTES:
+        return None
+    try:
+        return _build_variants(str(path), path.stat().st_mtime_ns, tuple(widths))
+    except OSError:
+        return None
+
+
+def responsive_image_html(path_str: str, alt: str, profile: str, attrs: str = "") -> str:
+    """``<picture>`` with AVIF/WebP sources over a JPEG/PNG ``<img>``, or a data-URI ``<img>`` fallback."""
+    settings = IMAGE_PROFILES[profile]
+    variants = get_variants(path_str, settings["widths"])
+    if not variants:
+        return f"<img src='{image_data_uri(path_str)}' alt='{alt}' {attrs}/>"
+
+    sizes = settings["sizes"]
+    srcsets = {
+        fmt: ", ".join(f"{url} {width}w" for width, url in entries) for fmt, entries in variants.items()
+    }
+    sources = "".join(
+        f"<source type='image/{fmt}' srcset='{srcsets[fmt]}' sizes='{sizes}'/>"
+        for fmt in ("avif", "webp")
+        if fmt in srcsets
+    )
+    fallback_fmt = list(variants)[-1]
+    fallback_url = variants[fallback_fmt][0][1]
+    return (
+        f"<picture>{sources}"
+        f"<img src='{fallback_url}' srcset='{srcsets[fallback_fmt]}' sizes='{sizes}' alt='{alt}' {attrs}/>"
+        "</picture>"
+    )
+
+
+def main() -> None:
+    from data import PROFILE
+
+    for key, profile in (("avatar", "avatar"), ("logo", "logo")):
+        path_str = PROFILE.get(key, "")
+        variants = get_variants(path_str, IMAGE_PROFILES[profile]["widths"])
+        if not variants:
+            print(f"{path_str}: using inline data URI")
+            continue
+        for fmt, entries in variants.items():
+            sizes = ", ".join(
+                f"{width}w={(STATIC_DIR / url.rsplit('/', 1)[-1]).stat().st_size // 1024} KB"
+                for width, url in entries
+            )
+            print(f"{path_str} [{fmt}] {sizes}")
+
+
+if __name__ == "__main__":
+    main()
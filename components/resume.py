@@ -7,6 +7,8 @@ from typing import Dict
 
 import streamlit as st
 
+from .static_files import publish_file
+
 @lru_cache(maxsize=1)
 def load_resume_base64(resume_path: str) -> str | None:
     path = Path(resume_path)
@@ -19,13 +21,23 @@ def load_resume_base64(resume_path: str) -> str | None:
     
 
 
+def resume_href(resume_path: str) -> str | None:
+    """Cacheable static URL for the resume, falling back to an inline data URI only if publishing fails."""
+    url = publish_file(resume_path, subdir="files")
+    if url:
+        return url
+    b64_pdf = load_resume_base64(resume_path)
+    return f"data:application/pdf;base64,{b64_pdf}" if b64_pdf else None
+
+
 def render_resume_section(resume: Dict) -> None:
-    b64_pdf = load_resume_base64(resume.get("path", ""))
+    href = resume_href(resume.get("path", ""))
     
-    if not b64_pdf:
+    if not href:
         st.error("Resume file is missing. Please add it to assets/ and refresh.")
         return
 
+    # The preview sits in a closed <details>, so the browser only fetches the PDF once it is opened.
     st.markdown(
         f"""
         <section class='section-shell'>
@@ -36,10 +48,13 @@ def render_resume_section(resume: Dict) -> None:
                 <p>{resume.get('tagline')}</p>
                 <small>Updated {resume.get('last_updated')}</small>
                 <div class='resume-actions'>
-                    <a class='solid-btn' href='data:application/pdf;base64,{b64_pdf}' download='{resume.get('file_name')}'>Download</a>
+                    <a class='solid-btn' href='{href}' download='{resume.get('file_name')}'>Download</a>
                 </div>
             </div>
-            <iframe src='data:application/pdf;base64,{b64_pdf}' title='Resume preview'></iframe>
+            <details class='resume-preview'>
+                <summary>Preview resume</summary>
+                <iframe src='{href}' title='Resume preview' loading='lazy'></iframe>
+            </details>
         </div>
         </section>
         """,
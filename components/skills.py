@@ -1,8 +1,12 @@
 """Skills grid rendering — now using flip-card layout for each skill."""
+import json
+from functools import lru_cache
 from textwrap import dedent
 from typing import Dict, List
 import streamlit as st
 
+from .icon_sprite import icon_html, sprite_version
+
 # Define a mapping of skill names to their corresponding Simple Icons identifiers
 SKILL_ICON_MAP = {
     "Python": "python",
@@ -41,104 +45,101 @@ SKILL_ICON_MAP = {
 DEFAULT_SKILL_ICON = "simpleicons"
 
 
-def render_skills(skill_groups: List[Dict]) -> str:
-    """Render skills grouped by category as flip-cards.
+def _skill_card_html(group: Dict) -> str:
+    """Flip-card grid for one category. Front: icon and name. Back: description and badges."""
+    flips: List[str] = []
+    for item in group.get("skills", []):
+        name = item.get("name", "Unnamed")
+        badges = item.get("badges", [])
+        desc = item.get("description", "")
 
-    Front: icon, name, meter. Back: badges/details.
-    """
-    categories = [group.get("category", "") for group in skill_groups]
-    filter_options = ["All"] + categories
+        icon_key = SKILL_ICON_MAP.get(name, DEFAULT_SKILL_ICON)
+        icon_markup = icon_html(f"https://cdn.simpleicons.org/{icon_key}", name, "skill-icon-img")
 
-    choice = st.selectbox("Filter skill category", filter_options, key="skills-filter")
+        back_badges = "".join(f"<span class='chip'>{b}</span>" for b in badges)
 
-    groups_to_render = (
-        skill_groups if choice == "All" else [group for group in skill_groups if group.get("category") == choice]
-    )
-
-    cards: List[str] = []
-    for group in groups_to_render:
-        flips: List[str] = []
-        for item in group.get("skills", []):
-            name = item.get("name", "Unnamed")
-            badges = item.get("badges", [])
-            desc = item.get("description", "")
-
-            icon_key = SKILL_ICON_MAP.get(name, DEFAULT_SKILL_ICON)
-            icon_url = f"https://cdn.simpleicons.org/{icon_key}"
-            icon_html = (
-                f"<img src=\"{icon_url}\" alt=\"{name}\" "
-                "class=\"skill-icon-img\" loading=\"lazy\" decoding=\"async\"/>"
-            )
-
-            back_badges = "".join(f"<span class='chip'>{b}</span>" for b in badges)
-
-            flips.append(
-                dedent(
-                    f"""
-                    <div class='flip-card'>
-                      <div class='flip-inner'>
-                        <div class='flip-front'>
-                          <div class='skill-row'>
-                            <div class='skill-icon'>{icon_html}</div>
-                            <div class='skill-meta'>
-                              <div class='skill-name'>{name}</div>
-                            </div>
-                          </div>
-                        </div>
-                        <div class='flip-back'>
-                          <div class='flip-back-inner'>
-                            <div class='skill-desc'>{desc}</div>
-                            <div class='tag-row'>{back_badges}</div>
-                          </div>
+        flips.append(
+            dedent(
+                f"""
+                <div class='flip-card'>
+                  <div class='flip-inner'>
+                    <div class='flip-front'>
+                      <div class='skill-row'>
+                        <div class='skill-icon'>{icon_markup}</div>
+                        <div class='skill-meta'>
+                          <div class='skill-name'>{name}</div>
                         </div>
                       </div>
                     </div>
-                    """
-                ).strip()
-            )
-
-        cards.append(
-            dedent(
-                f"""
-                <div class='skill-card'>
-                  <h4>{group.get('category')}</h4>
-                  <div class='flip-grid'>
-                    {''.join(flips)}
+                    <div class='flip-back'>
+                      <div class='flip-back-inner'>
+                        <div class='skill-desc'>{desc}</div>
+                        <div class='tag-row'>{back_badges}</div>
+                      </div>
+                    </div>
                   </div>
                 </div>
                 """
             ).strip()
         )
 
+    return dedent(
+        f"""
+        <div class='skill-card'>
+          <h4>{group.get('category')}</h4>
+          <div class='flip-grid'>
+            {''.join(flips)}
+          </div>
+        </div>
+        """
+    ).strip()
+
+
+@lru_cache(maxsize=4)
+def _build_index(groups_key: str, icons_version: int) -> Dict[str, str]:
+    # ``icons_version`` only keys the cache: building the sprite switches cards to local icons.
+    return {group.get("category", ""): _skill_card_html(group) for group in json.loads(groups_key)}
+
+
+def skills_index(skill_groups: List[Dict]) -> Dict[str, str]:
+    """Card markup per category, built once per distinct ``skill_groups`` content.
+
+    The index is keyed on the serialized groups and the icon sprite version, so editing
+    ``SKILL_GROUPS`` or rebuilding the sprite rebuilds it.
+    """
+    return _build_index(json.dumps(skill_groups, sort_keys=True), sprite_version())
+
+
+def render_skills(skill_groups: List[Dict]) -> str:
+    """Render skills grouped by category as flip-cards.
+
+    Front: icon, name, meter. Back: badges/details. Filtering is a lookup in ``skills_index``.
+    """
+    index = skills_index(skill_groups)
+    filter_options = ["All"] + list(index)
+
+    choice = st.selectbox("Filter skill category", filter_options, key="skills-filter")
+
+    cards = index.values() if choice == "All" else [index[choice]]
     return f"<div class='skill-grid'>{''.join(cards)}</div>"
 
 
 # Function to generate the HTML for skill icons
 def generate_skill_icon_html(skill_name):
     """
-    Generates an HTML <img> tag for the given skill name using the priority system:
-    1. Devicon SVG fallback
-    2. SimpleIcons CDN
-    3. Generic tech icon fallback
+    Generates the icon markup for the given skill name:
+    1. Symbol from the local SVG sprite (see components.icon_sprite)
+    2. SimpleIcons CDN image when the sprite does not have it
+    3. Generic tech icon for unmapped skills
 
     Args:
         skill_name (str): The name of the skill.
 
     Returns:
-        str: HTML <img> tag as a string.
+        str: HTML <svg> or <img> tag as a string.
     """
     icon_name = SKILL_ICON_MAP.get(skill_name, None)
     if icon_name:
-        devicon_url = f"https://raw.githubusercontent.com/devicons/devicon/master/icons/{icon_name}/{icon_name}-original.svg"
-        simpleicons_url = f"https://cdn.simpleicons.org/{icon_name}"
-        return (
-            f'<img src="{devicon_url}" '
-            f'onerror="this.onerror=null;this.src=\'{simpleicons_url}\';" '
-            f'width="22" height="auto" alt="{skill_name} icon">'
-        )
-    else:
-        # Generic tech icon fallback
-        return (
-            f'<img src="https://cdn.simpleicons.org/technology" '
-            f'width="22" height="auto" alt="Generic tech icon">'
-        )
\ No newline at end of file
+        return icon_html(f"https://cdn.simpleicons.org/{icon_name}", f"{skill_name} icon")
+    # Generic tech icon fallback, the same one the skill cards use (and bundled in the sprite)
+    return icon_html(f"https://cdn.simpleicons.org/{DEFAULT_SKILL_ICON}", "Generic tech icon")
@@ -0,0 +1,58 @@
+"""Publish generated or copied assets under Streamlit's static route with content-hashed names."""
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+from functools import lru_cache
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+# Served at ``app/static/`` because .streamlit/config.toml sets ``server.enableStaticServing``.
+STATIC_ROOT = ROOT_DIR / "static"
+STATIC_URL_ROOT = "app/static"
+
+
+def content_hash(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()[:12]
+
+
+def write_atomic(target: Path, write) -> None:
+    """Call ``write(tmp_path)`` then move the result into place, so readers never see partial files."""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    write(tmp_path)
+    os.replace(tmp_path, target)
+
+
+@lru_cache(maxsize=16)
+def _publish(path_str: str, mtime_ns: int, subdir: str) -> str:
+    source = Path(path_str)
+    name = f"{source.stem}-{content_hash(source)}{source.suffix.lower()}"
+    target = STATIC_ROOT / subdir / name
+    if not target.exists():
+        write_atomic(target, lambda tmp_path: shutil.copyfile(source, tmp_path))
+    return f"{STATIC_URL_ROOT}/{subdir}/{name}"
+
+
+def publish_file(path_str: str, subdir: str = "files") -> str | None:
+    """Copy ``path_str`` into ``static/<subdir>/`` once and return its URL, or ``None`` if that fails."""
+    path = Path(path_str)
+    if not path.is_file():
+        return None
+    try:
+        return _publish(str(path), path.stat().st_mtime_ns, subdir)
+    except OSError:
+        return None
+
+
+def publish_bytes(data: bytes, stem: str, suffix: str, subdir: str) -> str | None:
+    """Write generated ``data`` to ``static/<subdir>/<stem>-<hash><suffix>`` once and return its URL."""
+    name = f"{stem}-{hashlib.sha256(data).hexdigest()[:12]}{suffix}"
+    target = STATIC_ROOT / subdir / name
+    try:
+        if not target.exists():
+            write_atomic(target, lambda tmp_path: tmp_path.write_bytes(data))
+    except OSError:
+        return None
+    return f"{STATIC_URL_ROOT}/{subdir}/{name}"
@@ -0,0 +1,129 @@
+"""Throttling and duplicate suppression for the contact form.
+
+Checked before a submission touches the outbox or Postgres. Each browser session and each client
+address gets a token bucket; a submission spends one token from both, and buckets refill at a fixed
+rate. Submissions whose normalised (email, message) pair was accepted recently are dropped as
+duplicates. The duplicate set and the per-client buckets are bounded, evicting the least recently
+used entry, so a flood of distinct keys cannot grow memory.
+"""
+from __future__ import annotations
+
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict
+
+import streamlit as st
+
+# (capacity, seconds per refilled token)
+SESSION_RATE = (3, 60.0)
+CLIENT_RATE = (10, 30.0)
+MAX_CLIENTS = 10_000
+MAX_RECENT = 1_000
+
+ADMITTED = "admitted"
+THROTTLED = "throttled"
+DUPLICATE = "duplicate"
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+class TokenBucket:
+    """``capacity`` tokens, refilled one per ``interval`` seconds."""
+
+    def __init__(self, capacity: int, interval: float) -> None:
+        self.capacity = capacity
+        self.interval = interval
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) / self.interval)
+        self.updated = now
+
+    def available(self, now: float) -> bool:
+        self._refill(now)
+        return self.tokens >= 1
+
+    def take(self) -> None:
+        self.tokens -= 1
+
+
+def submission_key(email: str, message: str) -> bytes:
+    """Digest of the (email, message) pair, ignoring case and whitespace differences."""
+    normalised = f"{email.strip().casefold()}\0{_WHITESPACE_RE.sub(' ', message).strip().casefold()}"
+    return hashlib.sha256(normalised.encode("utf-8")).digest()
+
+
+class SubmissionGuard:
+    def __init__(self, max_clients: int = MAX_CLIENTS, max_recent: int = MAX_RECENT) -> None:
+        self.max_clients = max_clients
+        self.max_recent = max_recent
+        self._clients: OrderedDict[str, TokenBucket] = OrderedDict()
+        self._recent: OrderedDict[bytes, None] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {ADMITTED: 0, THROTTLED: 0, DUPLICATE: 0}
+
+    @staticmethod
+    def session_bucket() -> TokenBucket:
+        return TokenBucket(*SESSION_RATE)
+
+    def _client_bucket(self, client: str) -> TokenBucket:
+        bucket = self._clients.get(client)
+        if bucket is None:
+            bucket = self._clients[client] = TokenBucket(*CLIENT_RATE)
+            if len(self._clients) > self.max_clients:
+                self._clients.popitem(last=False)
+        else:
+            self._clients.move_to_end(client)
+        return bucket
+
+    def admit(self, session: TokenBucket, client: str | None, email: str, message: str) -> str:
+        """``ADMITTED``, ``THROTTLED`` or ``DUPLICATE``; only admitted submissions spend tokens."""
+        key = submission_key(email, message)
+        now = time.monotonic()
+        with self._lock:
+            buckets = [session] if client is None else [session, self._client_bucket(client)]
+            if not all(bucket.available(now) for bucket in buckets):
+                verdict = THROTTLED
+            elif key in self._recent:
+                self._recent.move_to_end(key)
+                verdict = DUPLICATE
+            else:
+                for bucket in buckets:
+                    bucket.take()
+                self._recent[key] = None
+                if len(self._recent) > self.max_recent:
+                    self._recent.popitem(last=False)
+                verdict = ADMITTED
+            self._stats[verdict] += 1
+        return verdict
+
+    def forget(self, email: str, message: str) -> None:
+        """Drop a pair from the duplicate set, e.g. when storing the admitted submission failed."""
+        with self._lock:
+            self._recent.pop(submission_key(email, message), None)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {**self._stats, "writes_avoided": self._stats[THROTTLED] + self._stats[DUPLICATE]}
+
+
+_GUARD = SubmissionGuard()
+
+
+def admit_submission(email: str, message: str) -> str:
+    """Check a form submission against this session's and this client's limits."""
+    session = st.session_state.setdefault("contact-bucket", _GUARD.session_bucket())
+    # ip_address is None when the app is served locally; the session bucket still applies then.
+    return _GUARD.admit(session, st.context.ip_address, email, message)
+
+
+def release_submission(email: str, message: str) -> None:
+    _GUARD.forget(email, message)
+
+
+def guard_stats() -> Dict[str, int]:
+    return _GUARD.stats()
@@ -0,0 +1,124 @@
+"""Local SQLite outbox for contact-form messages.
+
+Every submission is committed to the outbox database (``.cache/contact_outbox.db`` by default)
+before the form confirms it, so a message survives a Postgres outage or a restart. The table mirrors
+the Postgres ``contact_form`` table plus two bookkeeping columns: ``dedupe_key`` (a random id that
+makes replay idempotent) and ``delivered_at`` (set once the row is in Postgres). Timestamps are UTC,
+as SQLite's ``CURRENT_TIMESTAMP`` is. Delivered rows are deleted after ``RETENTION_DAYS``, so the
+outbox does not keep visitors' details longer than needed. The database runs in WAL mode so the
+form's inserts and the replayer's reads do not block each other.
+"""
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+OUTBOX_PATH = Path(
+    os.getenv("CONTACT_OUTBOX_PATH", Path(__file__).resolve().parent / ".cache" / "contact_outbox.db")
+)
+# Days a delivered row stays in the outbox; undelivered rows are never deleted.
+RETENTION_DAYS = float(os.getenv("CONTACT_OUTBOX_RETENTION_DAYS", "7"))
+# Milliseconds a writer waits for another connection's lock before raising "database is locked".
+BUSY_TIMEOUT_MS = 5000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS contact_form (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL,
+    message TEXT NOT NULL,
+    submitted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+)
+"""
+# Columns added on top of the original table.
+MIGRATIONS = {
+    "dedupe_key": "ALTER TABLE contact_form ADD COLUMN dedupe_key TEXT",
+    "delivered_at": "ALTER TABLE contact_form ADD COLUMN delivered_at TIMESTAMP",
+}
+# Rows written before the outbox existed count as delivered, so they are never replayed.
+BACKFILL = """
+UPDATE contact_form SET dedupe_key = 'legacy-' || id, delivered_at = submitted_at WHERE dedupe_key IS NULL;
+CREATE UNIQUE INDEX IF NOT EXISTS contact_form_dedupe_key ON contact_form (dedupe_key);
+CREATE INDEX IF NOT EXISTS contact_form_pending ON contact_form (id) WHERE delivered_at IS NULL;
+"""
+
+# (dedupe_key, name, email, message, submitted_at)
+OutboxRow = Tuple[str, str, str, str, str]
+
+
+class Outbox:
+    """Append-only message log with a delivery marker per row."""
+
+    def __init__(self, path: Path = OUTBOX_PATH) -> None:
+        self.path = path
+        self._ready = False
+        self._migrate_lock = threading.Lock()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        if not self._ready:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT_MS / 1000)
+        try:
+            # NORMAL is durable across application crashes in WAL mode; only an OS crash can drop the last commit.
+            conn.execute("PRAGMA synchronous = NORMAL")
+            if not self._ready:
+                with self._migrate_lock:
+                    if not self._ready:
+                        self._migrate(conn)
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _migrate(self, conn: sqlite3.Connection) -> None:
+        conn.execute("PRAGMA journal_mode = WAL")
+        with conn:
+            conn.execute(SCHEMA)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(contact_form)")}
+            for column, statement in MIGRATIONS.items():
+                if column not in columns:
+                    conn.execute(statement)
+        conn.executescript(BACKFILL)
+        self._ready = True
+
+    def add(self, name: str, email: str, message: str) -> str:
+        """Commit a submission locally and return its dedupe key."""
+        key = uuid.uuid4().hex
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO contact_form (name, email, message, dedupe_key) VALUES (?, ?, ?, ?)",
+                (name, email, message, key),
+            )
+        return key
+
+    def pending(self, limit: int) -> List[OutboxRow]:
+        """Oldest undelivered rows first."""
+        with self._connect() as conn:
+            return conn.execute(
+                "SELECT dedupe_key, name, email, message, submitted_at FROM contact_form "
+                "WHERE delivered_at IS NULL ORDER BY id LIMIT ?",
+                (limit,),
+            ).fetchall()
+
+    def mark_delivered(self, keys: List[str]) -> None:
+        """Mark rows as delivered and delete those delivered more than ``RETENTION_DAYS`` ago."""
+        with self._connect() as conn:
+            conn.executemany(
+                "UPDATE contact_form SET delivered_at = CURRENT_TIMESTAMP WHERE dedupe_key = ?",
+                [(key,) for key in keys],
+            )
+            conn.execute(
+                "DELETE FROM contact_form WHERE delivered_at < datetime('now', ?)",
+                (f"-{RETENTION_DAYS} days",),
+            )
+
+    def counts(self) -> Dict[str, int]:
+        with self._connect() as conn:
+            total, delivered = conn.execute("SELECT COUNT(*), COUNT(delivered_at) FROM contact_form").fetchone()
+        return {"stored": total, "undelivered": total - delivered}
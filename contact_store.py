@@ -0,0 +1,333 @@
+"""Postgres storage for contact-form messages.
+
+One bounded connection pool per process, created on first use. Connections idle for longer than
+``HEALTH_CHECK_IDLE`` seconds are pinged before being handed out, and broken ones are replaced.
+The schema is created lazily on the first write, or explicitly with ``python contact_store.py migrate``.
+
+The form does not write here directly: ``enqueue_message`` commits the submission to the local
+SQLite outbox (``contact_outbox``) and returns, and a background replayer delivers outbox rows in
+multi-row batches, retrying with backoff while the database is unreachable. ``python contact_store.py
+replay`` drains the outbox from the command line.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import random
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Iterator, List, Tuple
+
+import psycopg2
+import streamlit as st
+from psycopg2 import pool
+from psycopg2.extras import execute_values
+
+from contact_outbox import Outbox, OutboxRow
+
+logger = logging.getLogger(__name__)
+
+POOL_MIN = int(os.getenv("CONTACT_DB_POOL_MIN", "1"))
+POOL_MAX = int(os.getenv("CONTACT_DB_POOL_MAX", "4"))
+# Seconds a caller waits for a free connection before giving up.
+POOL_TIMEOUT = 10.0
+CONNECT_TIMEOUT = 5
+HEALTH_CHECK_IDLE = 30.0
+INBOX_PAGE_SIZE = 25
+
+BATCH_SIZE = 50
+# How long the replayer lets a burst of submissions collect before sending them as one batch.
+BATCH_WINDOW = 0.2
+# Idle replayer wake-up, which also picks up rows a previous process left undelivered.
+REPLAY_INTERVAL = 60.0
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 30.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS contact_form (
+    id SERIAL PRIMARY KEY,
+    name VARCHAR(255) NOT NULL,
+    email VARCHAR(255) NOT NULL,
+    message TEXT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+ALTER TABLE contact_form ADD COLUMN IF NOT EXISTS dedupe_key TEXT;
+CREATE UNIQUE INDEX IF NOT EXISTS contact_form_dedupe_key ON contact_form (dedupe_key);
+CREATE INDEX IF NOT EXISTS contact_form_created_id ON contact_form (created_at, id);
+CREATE INDEX IF NOT EXISTS contact_form_name_prefix ON contact_form (lower(name) text_pattern_ops);
+CREATE INDEX IF NOT EXISTS contact_form_email_prefix ON contact_form (lower(email) text_pattern_ops);
+"""
+
+_lock = threading.Lock()
+_pool: pool.ThreadedConnectionPool | None = None
+# ThreadedConnectionPool raises instead of blocking when exhausted; the semaphore makes callers wait.
+_slots = threading.BoundedSemaphore(POOL_MAX)
+_last_used: Dict[int, float] = {}
+_schema_ready = False
+
+
+def _connect_kwargs() -> Dict:
+    settings = st.secrets["DB"]
+    return {
+        "host": settings["DB_HOST"],
+        "database": settings["DB_NAME"],
+        "user": settings["DB_USER"],
+        "password": settings["DB_PASSWORD"],
+        "port": settings["DB_PORT"],
+        "sslmode": settings.get("DB_SSLMODE", "require"),
+        "connect_timeout": CONNECT_TIMEOUT,
+    }
+
+
+def _get_pool() -> pool.ThreadedConnectionPool:
+    global _pool
+    with _lock:
+        if _pool is None:
+            _pool = pool.ThreadedConnectionPool(POOL_MIN, POOL_MAX, **_connect_kwargs())
+        return _pool
+
+
+def _is_healthy(conn) -> bool:
+    if conn.closed:
+        return False
+    last_used = _last_used.get(id(conn))
+    # Fresh connections and recently used ones skip the round trip.
+    if last_used is None or time.monotonic() - last_used < HEALTH_CHECK_IDLE:
+        return True
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT 1")
+        conn.rollback()
+        return True
+    except psycopg2.Error:
+        return False
+
+
+@contextmanager
+def connection() -> Iterator:
+    """Borrow a pooled connection; commits on success, rolls back on error, always returns it."""
+    if not _slots.acquire(timeout=POOL_TIMEOUT):
+        raise pool.PoolError("no contact-form database connection available")
+    db_pool = conn = None
+    try:
+        db_pool = _get_pool()
+        conn = db_pool.getconn()
+        if not _is_healthy(conn):
+            logger.warning("Replacing a stale contact-form database connection")
+            _last_used.pop(id(conn), None)
+            db_pool.putconn(conn, close=True)
+            conn = db_pool.getconn()
+        yield conn
+        conn.commit()
+    except Exception:
+        if conn is not None and not conn.closed:
+            try:
+                conn.rollback()
+            except psycopg2.Error:
+                pass  # the connection is closed below; keep the original error
+        raise
+    finally:
+        if conn is not None:
+            if conn.closed:
+                _last_used.pop(id(conn), None)
+            else:
+                _last_used[id(conn)] = time.monotonic()
+            db_pool.putconn(conn, close=bool(conn.closed))
+        _slots.release()
+
+
+def ensure_schema() -> None:
+    """Create the contact table once per process."""
+    global _schema_ready
+    if _schema_ready:
+        return
+    with connection() as conn, conn.cursor() as cursor:
+        cursor.execute(SCHEMA)
+    _schema_ready = True
+
+
+def insert_message(name: str, email: str, message: str) -> None:
+    ensure_schema()
+    with connection() as conn, conn.cursor() as cursor:
+        cursor.execute(
+            "INSERT INTO contact_form (name, email, message) VALUES (%s, %s, %s)",
+            (name, email, message),
+        )
+
+
+def insert_messages(rows: List[OutboxRow]) -> None:
+    """Write outbox rows in one multi-row INSERT; rows whose dedupe key is already stored are skipped."""
+    ensure_schema()
+    with connection() as conn, conn.cursor() as cursor:
+        execute_values(
+            cursor,
+            "INSERT INTO contact_form (dedupe_key, name, email, message, created_at) VALUES %s "
+            "ON CONFLICT (dedupe_key) DO NOTHING",
+            rows,
+            # Outbox timestamps are UTC; created_at holds session-local time like its DEFAULT does.
+            template="(%s, %s, %s, %s, (%s::timestamp AT TIME ZONE 'UTC')::timestamp)",
+        )
+
+
+# (created_at, id) of the last row on a page; the next page starts strictly after it.
+InboxCursor = Tuple[datetime, int]
+
+
+def _like_prefix(text: str) -> str:
+    escaped = text.lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return escaped + "%"
+
+
+def fetch_inbox_page(
+    after: InboxCursor | None = None, search: str = "", limit: int = INBOX_PAGE_SIZE
+) -> Tuple[List[Tuple], InboxCursor | None]:
+    """One page of messages, newest first; returns (rows, cursor for the next page or ``None``).
+
+    Keyset pagination on ``(created_at, id)`` reads only the rows it returns, however deep the page,
+    and the search is a case-insensitive prefix match on name or email so it can use the prefix
+    indexes. Rows are pulled through a server-side cursor, one page at a time.
+    """
+    conditions, params = [], {"limit": limit + 1}
+    if search.strip():
+        conditions.append("(lower(name) LIKE %(prefix)s OR lower(email) LIKE %(prefix)s)")
+        params["prefix"] = _like_prefix(search.strip())
+    if after is not None:
+        conditions.append("(created_at, id) < (%(created_at)s, %(id)s)")
+        params["created_at"], params["id"] = after
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    ensure_schema()
+    with connection() as conn, conn.cursor(name="contact_inbox") as cursor:
+        cursor.itersize = limit + 1
+        cursor.execute(
+            f"SELECT id, created_at, name, email, message FROM contact_form {where} "
+            "ORDER BY created_at DESC, id DESC LIMIT %(limit)s",
+            params,
+        )
+        rows = cursor.fetchmany(limit + 1)
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, (rows[-1][1], rows[-1][0])
+
+
+class OutboxReplayer:
+    """Single background thread that drains the local outbox into Postgres.
+
+    Undelivered rows are sent oldest first in batches and marked delivered afterwards; a failed batch
+    is retried with jittered exponential backoff. A batch that reached Postgres but was not marked
+    (the process died in between) is sent again and skipped there by its dedupe key.
+    """
+
+    def __init__(self, outbox: Outbox, batch_size: int = BATCH_SIZE, window: float = BATCH_WINDOW) -> None:
+        self.outbox = outbox
+        self.batch_size = batch_size
+        self.window = window
+        self._wake = threading.Event()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._stats = {"accepted": 0, "rejected": 0, "replayed": 0, "batches": 0, "failures": 0}
+
+    def submit(self, name: str, email: str, message: str) -> bool:
+        """Commit a submission to the outbox; ``False`` only if the local write fails."""
+        try:
+            self.outbox.add(name, email, message)
+        except sqlite3.Error:
+            logger.exception("Could not store a contact message in the outbox")
+            with self._lock:
+                self._stats["rejected"] += 1
+            return False
+        with self._lock:
+            self._stats["accepted"] += 1
+        self.start()
+        self._wake.set()
+        return True
+
+    def start(self) -> None:
+        """Start the replayer thread, or a new one if the previous thread died."""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="contact-replayer", daemon=True)
+                self._thread.start()
+
+    def replay_once(self) -> int:
+        """Send the oldest undelivered batch; returns its size (0 when the outbox is drained)."""
+        rows = self.outbox.pending(self.batch_size)
+        if not rows:
+            return 0
+        insert_messages(rows)
+        self.outbox.mark_delivered([row[0] for row in rows])
+        with self._lock:
+            self._stats["replayed"] += len(rows)
+            self._stats["batches"] += 1
+        return len(rows)
+
+    def _run(self) -> None:
+        attempt = 0
+        while True:
+            try:
+                sent = self.replay_once()
+            except Exception as err:  # keep the thread alive through outages and missing settings
+                with self._lock:
+                    self._stats["failures"] += 1
+                delay = random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2**attempt))
+                logger.warning("Replaying contact messages failed (%s); retrying in %.1fs", err, delay)
+                time.sleep(delay)
+                attempt += 1
+                continue
+            attempt = 0
+            if sent == self.batch_size:
+                continue  # a full batch means more rows may be waiting
+            self._wake.wait(REPLAY_INTERVAL)
+            self._wake.clear()
+            time.sleep(self.window)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            stats = dict(self._stats)
+        return {**stats, **self.outbox.counts()}
+
+
+_REPLAYER = OutboxReplayer(Outbox())
+
+
+def enqueue_message(name: str, email: str, message: str) -> bool:
+    """Store a form submission locally for background delivery; ``False`` if it could not be stored."""
+    return _REPLAYER.submit(name, email, message)
+
+
+def start_replay() -> None:
+    """Start delivering rows a previous process left in the outbox (no-op once running)."""
+    _REPLAYER.start()
+
+
+def submission_stats() -> Dict[str, int]:
+    return _REPLAYER.stats()
+
+
+def close_pool() -> None:
+    global _pool, _schema_ready
+    with _lock:
+        if _pool is not None:
+            _pool.closeall()
+        _pool = None
+        _schema_ready = False
+        _last_used.clear()
+
+
+if __name__ == "__main__":
+    import sys
+
+    command = sys.argv[1:]
+    if command == ["migrate"]:
+        ensure_schema()
+        print("contact_form schema is up to date")
+    elif command == ["replay"]:
+        delivered = 0
+        while sent := _REPLAYER.replay_once():
+            delivered += sent
+        print(f"Delivered {delivered} outbox messages to Postgres")
+    else:
+        sys.exit("usage: python contact_store.py migrate|replay")
@@ -236,7 +236,17 @@ RESUME = {
 
 GITHUB_CONFIG = {
     "username": "Shikher-jain",
-    "topic": "portfolio"
+    "topic": "portfolio",
+    # "rest" or "graphql"; GraphQL needs GITHUB_TOKEN and falls back to REST without it.
+    "backend": "rest",
+    # Seconds an offline snapshot (python snapshot.py build) may be served before fetching live.
+    "snapshot_max_age": 24 * 3600,
+}
+
+RENDER_CONFIG = {
+    # Paint static sections first and fill the GitHub-backed ones (projects, snapshot) last, in
+    # skeleton slots that keep their place in the page. False renders strictly top to bottom.
+    "progressive": True,
 }
 
 FEATURED_TOPIC_TAGS = {"portfolio", "feature"}
@@ -2,19 +2,168 @@
 from __future__ import annotations
 
 import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from functools import lru_cache
-from typing import Dict, List
+from typing import Callable, Dict, List, TypeVar
 
 import requests
 import streamlit as st
+from requests.adapters import HTTPAdapter
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
-API_BASE = "https://api.github.com"
+from data import PROJECT_SHORTLIST
+from http_cache import ConditionalCache, TTLStore
+from swr_cache import stale_while_revalidate
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Overridable so a local stand-in (benchmarks/github_stub.py) can replace api.github.com.
+API_BASE = os.getenv("GITHUB_API_BASE", "https://api.github.com").rstrip("/")
+GRAPHQL_URL = f"{API_BASE}/graphql"
 TIMEOUT = 15
+# Upper bound on concurrent /languages calls while enriching a search page.
+LANGUAGE_FETCH_WORKERS = int(os.getenv("GITHUB_LANGUAGE_WORKERS", "8"))
+# Language lists are keyed on pushed_at; the TTL only bounds drift from renames or force-pushes.
+LANGUAGE_CACHE_TTL = float(os.getenv("GITHUB_LANGUAGE_CACHE_TTL", str(7 * 24 * 3600)))
+MAX_RETRIES = 3
+BACKOFF_BASE = 0.5
+# Longest we are willing to stall a render for; larger Retry-After values are not retried.
+BACKOFF_CAP = 20.0
+# No retry is started once a call (attempts plus backoff) has taken this long.
+RETRY_BUDGET = 20.0
+# Calls per rate-limit window held back for essential requests: one per shortlisted repo, the
+# profile summary and one spare for a retry. Optional enrichment stops once the budget reaches it.
+RATE_LIMIT_RESERVE = int(os.getenv("GITHUB_RATE_LIMIT_RESERVE", str(len(PROJECT_SHORTLIST) + 2)))
 
-_LANGUAGE_FETCH_DISABLED = False
 _LANGUAGE_RATE_NOTICE_SHOWN = False
 
+_SESSION: requests.Session | None = None
+_SESSION_LOCK = threading.Lock()
+
+
+class _RateLimitTracker:
+    """Remaining budget per GitHub rate-limit resource, learned from ``X-RateLimit-*`` headers."""
+
+    def __init__(self, reserve: int) -> None:
+        self.reserve = reserve
+        self._budgets: Dict[str, Dict[str, float]] = {}
+        self._optional_paused_until: Dict[str, float] = {}
+        self._in_flight: Dict[str, int] = {}
+        self._warned_windows: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def record(self, headers) -> None:
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        if remaining is None or reset is None:
+            return
+        resource = headers.get("X-RateLimit-Resource", "core")
+        budget = {"remaining": int(remaining), "reset": float(reset)}
+        with self._lock:
+            current = self._budgets.get(resource)
+            # Concurrent responses can arrive out of order; within one window the budget only shrinks.
+            if current is not None and current["reset"] == budget["reset"]:
+                budget["remaining"] = min(budget["remaining"], current["remaining"])
+            self._budgets[resource] = budget
+
+    def pause(self, resource: str, seconds: float) -> None:
+        """Treat ``resource`` as exhausted for ``seconds`` (403s that carry no budget headers)."""
+        with self._lock:
+            self._budgets[resource] = {"remaining": 0, "reset": time.time() + seconds}
+
+    def pause_optional(self, resource: str, until: float) -> None:
+        """Stop optional calls on ``resource`` until ``until`` while leaving essential calls alone."""
+        with self._lock:
+            self._optional_paused_until[resource] = until
+
+    def _allows_locked(self, resource: str, essential: bool, now: float) -> bool:
+        if not essential and now < self._optional_paused_until.get(resource, 0):
+            return False
+        budget = self._budgets.get(resource)
+        if budget is None or now >= budget["reset"]:
+            return True
+        # Calls already in flight have not reported their cost yet, so they count as spent.
+        available = budget["remaining"] - self._in_flight.get(resource, 0)
+        return available > (0 if essential else self.reserve)
+
+    def allows(self, resource: str, essential: bool) -> bool:
+        with self._lock:
+            return self._allows_locked(resource, essential, time.time())
+
+    def acquire(self, resource: str, essential: bool) -> bool:
+        """Like ``allows``, but also counts the call as in flight until ``release``."""
+        with self._lock:
+            if not self._allows_locked(resource, essential, time.time()):
+                return False
+            self._in_flight[resource] = self._in_flight.get(resource, 0) + 1
+            return True
+
+    def release(self, resource: str) -> None:
+        with self._lock:
+            self._in_flight[resource] -= 1
+
+    def first_refusal(self, resource: str) -> bool:
+        """``True`` for the first refused essential call per reset window, so the page warns once."""
+        with self._lock:
+            reset = self._budgets.get(resource, {}).get("reset", 0.0)
+            if self._warned_windows.get(resource) == reset:
+                return False
+            self._warned_windows[resource] = reset
+            return True
+
+    def reset_at(self, resource: str) -> float | None:
+        with self._lock:
+            budget = self._budgets.get(resource)
+        return budget["reset"] if budget else None
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {resource: dict(budget) for resource, budget in self._budgets.items()}
+
+
+_RATE_LIMITS = _RateLimitTracker(RATE_LIMIT_RESERVE)
+
+_CACHE_PATH = os.getenv(
+    "GITHUB_HTTP_CACHE", os.path.join(os.path.dirname(__file__), ".cache", "github_http.sqlite3")
+)
+# Survives restarts so unchanged resources are revalidated with 304s instead of refetched.
+_HTTP_CACHE = ConditionalCache(
+    _CACHE_PATH, max_bytes=int(os.getenv("GITHUB_HTTP_CACHE_MAX_BYTES", str(20 * 1024 * 1024)))
+)
+_LANGUAGE_CACHE = TTLStore(_CACHE_PATH, table="languages", ttl=LANGUAGE_CACHE_TTL)
+
+_GRAPHQL_REPO_FIELDS = """
+fragment RepoFields on Repository {
+  name
+  nameWithOwner
+  description
+  stargazerCount
+  forkCount
+  url
+  homepageUrl
+  defaultBranchRef { name }
+  pushedAt
+  repositoryTopics(first: 20) { nodes { topic { name } } }
+  languages(first: 5, orderBy: {field: SIZE, direction: DESC}) { nodes { name } }
+}
+"""
+
+_GRAPHQL_SEARCH_QUERY = (
+    """
+query($query: String!, $first: Int!, $after: String) {
+  search(query: $query, type: REPOSITORY, first: $first, after: $after) {
+    pageInfo { hasNextPage endCursor }
+    nodes { ...RepoFields }
+  }
+}
+"""
+    + _GRAPHQL_REPO_FIELDS
+)
+
 
 def _build_headers() -> Dict[str, str]:
     token = os.getenv("GITHUB_TOKEN")
@@ -27,22 +176,126 @@ def _build_headers() -> Dict[str, str]:
     return headers
 
 
-def _safe_request(url: str, params: Dict | None = None) -> Dict | List | None:
-    global _LANGUAGE_FETCH_DISABLED, _LANGUAGE_RATE_NOTICE_SHOWN
+def _get_session() -> requests.Session:
+    """Shared keep-alive session; its urllib3 pool is sized for the language worker threads."""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max(10, LANGUAGE_FETCH_WORKERS))
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _SESSION = session
+    return _SESSION
+
+
+def _is_retryable(response: requests.Response) -> bool:
+    if response.status_code >= 500:
+        return True
+    if response.status_code in (403, 429):
+        # Secondary rate limits carry Retry-After or say so in the body; primary limits do neither.
+        return "Retry-After" in response.headers or "secondary rate limit" in response.text.lower()
+    return False
+
+
+def _retry_delay(response: requests.Response | None, attempt: int) -> float | None:
+    retry_after = response.headers.get("Retry-After", "") if response is not None else ""
+    if retry_after.isdigit():
+        delay = float(retry_after)
+        return delay if delay <= BACKOFF_CAP else None
+    return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2**attempt))
+
+
+def _send(method: str, url: str, **kwargs) -> requests.Response:
+    """Issue a GitHub call on the pooled session, backing off on 5xx and secondary rate limits.
+
+    Failed connects are retried too, but a read timeout is not: a server that accepts and never
+    answers would otherwise cost the full ``TIMEOUT`` on every attempt.
+    """
+    session = _get_session()
+    deadline = time.monotonic() + RETRY_BUDGET
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            response = session.request(method, url, timeout=TIMEOUT, **kwargs)
+        except requests.ConnectionError:
+            delay = _retry_delay(None, attempt)
+            if attempt == MAX_RETRIES or time.monotonic() + delay > deadline:
+                raise
+            time.sleep(delay)
+            continue
+        _RATE_LIMITS.record(response.headers)
+        if attempt == MAX_RETRIES or not _is_retryable(response):
+            return response
+        delay = _retry_delay(response, attempt)
+        if delay is None or time.monotonic() + delay > deadline:
+            return response
+        time.sleep(delay)
+    return response
+
+
+def _resource_for(url: str) -> str:
+    if url == GRAPHQL_URL:
+        return "graphql"
+    return "search" if "/search/" in url else "core"
+
+
+def _notify_language_limit() -> None:
+    global _LANGUAGE_RATE_NOTICE_SHOWN
+    if not _LANGUAGE_RATE_NOTICE_SHOWN:
+        st.info("GitHub language metadata limit reached; continuing without per-repo language badges.")
+        _LANGUAGE_RATE_NOTICE_SHOWN = True
+
+
+def _safe_request(url: str, params: Dict | None = None, essential: bool = True) -> Dict | List | None:
+    """GET a GitHub resource, or ``None`` on failure.
+
+    Optional calls (``essential=False``) are skipped while the resource's remaining budget, less the
+    calls still in flight, is within ``RATE_LIMIT_RESERVE`` so search and shortlist lookups keep
+    working; both resume after the reset. A refused essential call warns once per reset window.
+    """
+    cached = _HTTP_CACHE.lookup(url, params)
+    if cached is not None and cached.is_fresh:
+        return cached.body
+
+    resource = _resource_for(url)
+    tracker = _RATE_LIMITS
+    if not tracker.acquire(resource, essential):
+        if not essential:
+            _notify_language_limit()
+            return None
+        if tracker.first_refusal(resource):
+            reset_at = datetime.fromtimestamp(tracker.reset_at(resource) or time.time())
+            st.warning(f"GitHub API rate limit reached; retrying after {reset_at:%H:%M}.")
+        return cached.body if cached is not None else None
+
+    headers = _build_headers()
+    if cached is not None:
+        headers.update(cached.conditional_headers())
     try:
-        response = requests.get(url, headers=_build_headers(), params=params, timeout=TIMEOUT)
+        try:
+            response = _send("GET", url, headers=headers, params=params)
+        finally:
+            tracker.release(resource)
+        if response.status_code == 304 and cached is not None:
+            _HTTP_CACHE.mark_revalidated(url, params, response.headers)
+            return cached.body
         response.raise_for_status()
-        return response.json()
+        payload = response.json()
+        _HTTP_CACHE.store(url, params, payload, response.headers)
+        return payload
     except requests.HTTPError as exc:  # pragma: no cover - network failure path
         status_code = exc.response.status_code if exc.response is not None else None
-        if status_code == 403 and "/languages" in url:
-            _LANGUAGE_FETCH_DISABLED = True
-            if not _LANGUAGE_RATE_NOTICE_SHOWN:
-                st.info(
-                    "GitHub language metadata limit reached; continuing without per-repo language badges."
-                )
-                _LANGUAGE_RATE_NOTICE_SHOWN = True
-            return None
+        if status_code in (403, 429):
+            response_headers = exc.response.headers
+            if "X-RateLimit-Remaining" not in response_headers:
+                retry_after = response_headers.get("Retry-After", "")
+                _RATE_LIMITS.pause(resource, float(retry_after) if retry_after.isdigit() else 60.0)
+            if not essential:
+                # A refused enrichment call will keep being refused; hold the rest until the window resets.
+                reset = response_headers.get("X-RateLimit-Reset", "")
+                _RATE_LIMITS.pause_optional(resource, float(reset) if reset.isdigit() else time.time() + 60.0)
+                _notify_language_limit()
+                return None
         st.warning(f"GitHub API request failed: {exc}")
         return None
     except requests.RequestException as exc:  # pragma: no cover - network failure path
@@ -50,15 +303,77 @@ def _safe_request(url: str, params: Dict | None = None) -> Dict | List | None:
         return None
 
 
-@lru_cache(maxsize=128)
-def _fetch_languages(url: str) -> List[str]:
-    if _LANGUAGE_FETCH_DISABLED:
+def http_cache_stats() -> Dict[str, int]:
+    """Hit / miss / revalidation counters for the persistent GitHub response cache."""
+    return _HTTP_CACHE.stats()
+
+
+def language_cache_stats() -> Dict[str, int]:
+    """Hit / miss counters for the shared per-repo language cache."""
+    return _LANGUAGE_CACHE.stats()
+
+
+def rate_limit_status() -> Dict[str, Dict[str, float]]:
+    """Last seen ``remaining`` / ``reset`` (epoch seconds) per GitHub rate-limit resource."""
+    return _RATE_LIMITS.snapshot()
+
+
+def clear_caches(persistent: bool = True) -> None:
+    """Forget every cached GitHub result and rate-limit budget; ``persistent`` also empties the disk cache."""
+    global _RATE_LIMITS
+    fetch_portfolio_repositories.clear()
+    _hydrate_repositories.clear()
+    fetch_github_summary.clear()
+    _RATE_LIMITS = _RateLimitTracker(RATE_LIMIT_RESERVE)
+    if persistent:
+        _HTTP_CACHE.clear()
+        _LANGUAGE_CACHE.clear()
+
+
+def _fetch_languages(repo: Dict) -> List[str]:
+    """Top-5 languages for a REST repo payload, cached per repo and push across worker processes.
+
+    Keying on ``pushed_at`` means a repo costs one ``/languages`` call per push; failed or skipped
+    lookups are never stored, so they are retried once the budget allows.
+    """
+    url = repo.get("languages_url", "")
+    if not url:
         return []
-    payload = _safe_request(url)
-    if not payload:
+    key = f"{url}@{repo.get('pushed_at', '')}"
+    cached = _LANGUAGE_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    payload = _safe_request(url, essential=False)
+    if payload is None:
         return []
     sorted_langs = sorted(payload.items(), key=lambda item: item[1], reverse=True)
-    return [name for name, _ in sorted_langs[:5]]
+    languages = [name for name, _ in sorted_langs[:5]]
+    _LANGUAGE_CACHE.set(key, languages)
+    return languages
+
+
+def _map_concurrently(
+    func: Callable[[T], R], items: List[T], max_workers: int = LANGUAGE_FETCH_WORKERS
+) -> List[R]:
+    """Apply ``func`` to every item on a bounded pool, preserving input order."""
+    if max_workers <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+
+    # Worker threads inherit the script context so rate-limit notices still reach the page.
+    ctx = get_script_run_ctx()
+
+    def _attach_ctx() -> None:
+        if ctx is not None:
+            add_script_run_ctx(threading.current_thread(), ctx)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items)), initializer=_attach_ctx) as pool:
+        return list(pool.map(func, items))
+
+
+def _fetch_languages_bulk(repos: List[Dict], max_workers: int = LANGUAGE_FETCH_WORKERS) -> List[List[str]]:
+    """Resolve language lists for many repos on a bounded pool, preserving input order."""
+    return _map_concurrently(_fetch_languages, repos, max_workers)
 
 
 def _infer_category(topics: List[str]) -> str:
@@ -83,20 +398,75 @@ def _format_timestamp(ts: str) -> str:
         return ts
 
 
-@st.cache_data(ttl=3600, show_spinner=False)
-def fetch_portfolio_repositories(
-    username: str,
-    topic: str = "portfolio",
-    max_items: int = 60,
-) -> List[Dict]:
-    """Search repositories by topic (spanning multiple pages) and enrich them with language metadata."""
+def _normalize_repo(repo: Dict, languages: List[str]) -> Dict:
+    """Map a REST repository payload onto the dict shape the components consume."""
+    topics = repo.get("topics", [])
+    return {
+        "name": repo.get("name"),
+        "full_name": repo.get("full_name"),
+        "description": repo.get("description") or "Production-ready AI asset.",
+        "languages": languages,
+        "stars": repo.get("stargazers_count", 0),
+        "forks": repo.get("forks_count", 0),
+        "html_url": repo.get("html_url"),
+        "homepage": repo.get("homepage") or "",
+        "topics": topics,
+        "category": _infer_category(topics),
+        "default_branch": repo.get("default_branch", "main"),
+        "pushed_at": repo.get("pushed_at") or "",
+    }
+
+
+def _normalize_graphql_repo(node: Dict) -> Dict:
+    """Translate a GraphQL ``Repository`` node into the REST field names, then normalise it."""
+    topic_nodes = (node.get("repositoryTopics") or {}).get("nodes", [])
+    language_nodes = (node.get("languages") or {}).get("nodes", [])
+    rest_shape = {
+        "name": node.get("name"),
+        "full_name": node.get("nameWithOwner"),
+        "description": node.get("description"),
+        "stargazers_count": node.get("stargazerCount", 0),
+        "forks_count": node.get("forkCount", 0),
+        "html_url": node.get("url"),
+        "homepage": node.get("homepageUrl"),
+        "topics": [item["topic"]["name"] for item in topic_nodes if item.get("topic")],
+        "default_branch": (node.get("defaultBranchRef") or {}).get("name", "main"),
+        "pushed_at": node.get("pushedAt"),
+    }
+    return _normalize_repo(rest_shape, [item["name"] for item in language_nodes][:5])
+
+
+def _graphql_request(query: str, variables: Dict) -> Dict | None:
+    if not _RATE_LIMITS.allows("graphql", essential=True):
+        # Callers fall back to REST, which has its own budget.
+        return None
+    try:
+        response = _send(
+            "POST", GRAPHQL_URL, headers=_build_headers(), json={"query": query, "variables": variables}
+        )
+        response.raise_for_status()
+        payload = response.json()
+    except requests.RequestException as exc:  # pragma: no cover - network failure path
+        st.warning(f"GitHub GraphQL request failed: {exc}")
+        return None
+    # Missing repositories come back as per-alias errors alongside partial data; only bail without data.
+    if not payload.get("data"):
+        st.warning(f"GitHub GraphQL request failed: {payload.get('errors')}")
+        return None
+    return payload["data"]
+
 
+def _use_graphql(backend: str) -> bool:
+    # The GraphQL API rejects anonymous calls, so without a token we stay on REST.
+    return backend == "graphql" and bool(os.getenv("GITHUB_TOKEN"))
+
+
+def _rest_search_repositories(username: str, topic: str, limit: int, max_workers: int) -> List[Dict]:
     projects: List[Dict] = []
     page = 1
-    remaining = max(1, max_items)
 
-    while len(projects) < remaining:
-        per_page = min(100, remaining - len(projects))
+    while len(projects) < limit:
+        per_page = min(100, limit - len(projects))
         params = {
             "q": f"user:{username} topic:{topic}",
             "sort": "updated",
@@ -112,64 +482,151 @@ def fetch_portfolio_repositories(
         if not items:
             break
 
-        for repo in items:
-            languages = _fetch_languages(repo.get("languages_url", ""))
-            topics = repo.get("topics", [])
-            projects.append(
-                {
-                    "name": repo.get("name"),
-                    "full_name": repo.get("full_name"),
-                    "description": repo.get("description") or "Production-ready AI asset.",
-                    "languages": languages,
-                    "stars": repo.get("stargazers_count", 0),
-                    "forks": repo.get("forks_count", 0),
-                    "html_url": repo.get("html_url"),
-                    "homepage": repo.get("homepage") or "",
-                    "topics": topics,
-                    "category": _infer_category(topics),
-                    "default_branch": repo.get("default_branch", "main"),
-                }
-            )
+        page_languages = _fetch_languages_bulk(items, max_workers=max_workers)
+        projects.extend(_normalize_repo(repo, languages) for repo, languages in zip(items, page_languages))
 
         if len(items) < per_page:
             break
 
         page += 1
 
-    return projects[:remaining]
+    return projects[:limit]
+
+
+def _graphql_search_repositories(username: str, topic: str, limit: int) -> List[Dict] | None:
+    projects: List[Dict] = []
+    cursor = None
+
+    while len(projects) < limit:
+        data = _graphql_request(
+            _GRAPHQL_SEARCH_QUERY,
+            {
+                "query": f"user:{username} topic:{topic} sort:updated-desc",
+                "first": min(100, limit - len(projects)),
+                "after": cursor,
+            },
+        )
+        if data is None:
+            return projects or None
+
+        search = data.get("search") or {}
+        nodes = [node for node in search.get("nodes", []) if node]
+        projects.extend(_normalize_graphql_repo(node) for node in nodes)
 
+        page_info = search.get("pageInfo") or {}
+        if not nodes or not page_info.get("hasNextPage"):
+            break
+        cursor = page_info.get("endCursor")
+
+    return projects[:limit]
 
-@st.cache_data(ttl=1800, show_spinner=False)
-def fetch_repository(username: str, repo_name: str) -> Dict | None:
-    """Fetch a single repository's metadata regardless of topic filters."""
 
-    if not username or not repo_name:
+def _graphql_fetch_repositories(username: str, names: List[str]) -> Dict[str, Dict | None] | None:
+    """Resolve many repositories in a single aliased query; ``None`` means the request itself failed."""
+    if not names:
+        return {}
+    declarations = ", ".join(f"$n{idx}: String!" for idx in range(len(names)))
+    fields = "\n".join(
+        f"  r{idx}: repository(owner: $owner, name: $n{idx}) {{ ...RepoFields }}" for idx in range(len(names))
+    )
+    query = f"query($owner: String!, {declarations}) {{\n{fields}\n}}\n{_GRAPHQL_REPO_FIELDS}"
+    variables = {"owner": username, **{f"n{idx}": name for idx, name in enumerate(names)}}
+
+    data = _graphql_request(query, variables)
+    if data is None:
         return None
+    return {
+        name: _normalize_graphql_repo(data[f"r{idx}"]) if data.get(f"r{idx}") else None
+        for idx, name in enumerate(names)
+    }
+
 
+def _rest_fetch_repository(username: str, repo_name: str) -> Dict | None:
     payload = _safe_request(f"{API_BASE}/repos/{username}/{repo_name}")
     if not payload:
         return None
 
-    languages = _fetch_languages(payload.get("languages_url", ""))
-    topics = payload.get("topics", [])
+    languages = _fetch_languages(payload)
+    return _normalize_repo(payload, languages)
+
+
+@stale_while_revalidate(ttl=3600)
+def fetch_portfolio_repositories(
+    username: str,
+    topic: str = "portfolio",
+    max_items: int = 60,
+    max_workers: int = LANGUAGE_FETCH_WORKERS,
+    backend: str = "rest",
+) -> List[Dict]:
+    """Search repositories by topic (spanning multiple pages) and enrich them with language metadata.
+
+    With ``backend="graphql"`` (and a token) each page of up to 100 repos, languages included, is one
+    query; otherwise REST search pages are enriched through up to ``max_workers`` concurrent
+    ``/languages`` calls, and ``max_workers=1`` keeps the original serial behaviour.
+    """
+
+    remaining = max(1, max_items)
+    if _use_graphql(backend):
+        projects = _graphql_search_repositories(username, topic, remaining)
+        if projects is not None:
+            return projects
+    return _rest_search_repositories(username, topic, remaining, max_workers)
+
+
+def fetch_repository(username: str, repo_name: str, backend: str = "rest") -> Dict | None:
+    """Fetch a single repository's metadata regardless of topic filters (see ``fetch_repositories``)."""
+
+    return fetch_repositories(username, [repo_name], backend=backend).get(repo_name)
+
+
+@stale_while_revalidate(ttl=1800, is_valid=lambda resolved: any(resolved.values()))
+def _hydrate_repositories(
+    username: str, names: List[str], backend: str = "rest", max_workers: int = LANGUAGE_FETCH_WORKERS
+) -> Dict[str, Dict | None]:
+    resolved = _graphql_fetch_repositories(username, names) if _use_graphql(backend) else None
+    if resolved is None:
+        hydrated = _map_concurrently(lambda name: _rest_fetch_repository(username, name), names, max_workers)
+        resolved = dict(zip(names, hydrated))
+    return resolved
+
+
+def fetch_repositories(
+    username: str,
+    names: List[str],
+    fallbacks: Dict[str, Dict] | None = None,
+    backend: str = "rest",
+    max_workers: int = LANGUAGE_FETCH_WORKERS,
+) -> Dict[str, Dict | None]:
+    """Hydrate many repositories at once, keyed by the requested name in request order.
+
+    GraphQL resolves every name in one aliased query; REST fetches them concurrently. Names GitHub
+    cannot return use the matching ``fallbacks`` entry (case-insensitive) or map to ``None``.
+    """
+
+    names = [name for name in names if name]
+    if not username or not names:
+        return {}
+
+    resolved = _hydrate_repositories(username, names, backend=backend, max_workers=max_workers)
+    fallback_map = {key.lower(): value for key, value in (fallbacks or {}).items()}
     return {
-        "name": payload.get("name"),
-        "full_name": payload.get("full_name"),
-        "description": payload.get("description") or "Production-ready AI asset.",
-        "languages": languages,
-        "stars": payload.get("stargazers_count", 0),
-        "forks": payload.get("forks_count", 0),
-        "html_url": payload.get("html_url"),
-        "homepage": payload.get("homepage") or "",
-        "topics": topics,
-        "category": _infer_category(topics),
-        "default_branch": payload.get("default_branch", "main"),
+        name: resolved.get(name) or ({**fallback_map[name.lower()]} if name.lower() in fallback_map else None)
+        for name in names
     }
 
 
-@st.cache_data(ttl=3600, show_spinner=False)
+def shortlist_misses(repos: List[Dict], shortlist: List[str]) -> List[str]:
+    """Shortlisted names (in shortlist order) that ``repos`` does not already contain."""
+    present = {(repo.get("name") or "").lower() for repo in repos}
+    return [name for name in shortlist if name.lower() not in present]
+
+
+@stale_while_revalidate(ttl=3600, is_valid=lambda summary: bool(summary.get("avatar_url")))
 def fetch_github_summary(username: str, repos: List[Dict] | None = None) -> Dict:
-    """Aggregate lightweight stats for the hero + stats widgets."""
+    """Aggregate lightweight stats for the hero + stats widgets.
+
+    An empty ``avatar_url`` means the profile call failed, so that result never replaces a good one.
+    """
     profile = _safe_request(f"{API_BASE}/users/{username}") or {}
     repos = repos or []
     total_stars = sum(item.get("stars", 0) for item in repos)
@@ -184,3 +641,30 @@ def fetch_github_summary(username: str, repos: List[Dict] | None = None) -> Dict
         "latest_repo": latest_repo,
         "contribution_graph": f"https://ghchart.rshah.org/{username}",
     }
+
+
+def snapshot_state(username: str, topic: str, shortlist: List[str], backend: str = "rest") -> Dict:
+    """Run the fetches behind the first page paint and return their results as plain data."""
+    repos = fetch_portfolio_repositories(username=username, topic=topic, backend=backend)
+    misses = shortlist_misses(repos, shortlist)
+    return {
+        "username": username,
+        "topic": topic,
+        "backend": backend,
+        "repositories": repos,
+        "shortlist": _hydrate_repositories(username, misses, backend=backend) if misses else {},
+        "summary": fetch_github_summary(username),
+    }
+
+
+def restore_state(state: Dict, fetched_at: float) -> None:
+    """Seed the feed caches from ``snapshot_state`` output so the first render needs no network."""
+    username, backend = state["username"], state["backend"]
+    fetch_portfolio_repositories.prime(
+        state["repositories"], fetched_at, username=username, topic=state["topic"], backend=backend
+    )
+    if state["shortlist"]:
+        _hydrate_repositories.prime(
+            state["shortlist"], fetched_at, username, list(state["shortlist"]), backend=backend
+        )
+    fetch_github_summary.prime(state["summary"], fetched_at, username)
@@ -0,0 +1,220 @@
+"""On-disk caches for GitHub data: conditional HTTP responses and TTL'd derived values.
+
+Both live in SQLite (WAL mode), so every Streamlit worker process on the host shares them.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List
+
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+
+def _connect(path: Path) -> sqlite3.Connection:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path, timeout=10, check_same_thread=False)
+    # WAL lets several processes read while one writes.
+    conn.execute("PRAGMA journal_mode=WAL")
+    return conn
+
+
+@dataclass
+class CachedResponse:
+    body: Dict | List
+    etag: str
+    last_modified: str
+    fresh_until: float
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.time() < self.fresh_until
+
+    def conditional_headers(self) -> Dict[str, str]:
+        headers: Dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ConditionalCache:
+    """Persist JSON responses keyed by URL + params so restarts can revalidate instead of refetching.
+
+    Entries are served without a request while the response's ``Cache-Control: max-age`` holds,
+    revalidated with conditional headers afterwards, and evicted least-recently-used once the
+    stored bodies exceed ``max_bytes``.
+    """
+
+    def __init__(self, path: str | Path, max_bytes: int = 20 * 1024 * 1024) -> None:
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._stats = {"hits": 0, "misses": 0, "revalidated": 0, "evictions": 0}
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = _connect(self.path)
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    url TEXT NOT NULL,
+                    etag TEXT NOT NULL DEFAULT '',
+                    last_modified TEXT NOT NULL DEFAULT '',
+                    body TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    fresh_until REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+                """
+            )
+            self._conn.commit()
+        return self._conn
+
+    @staticmethod
+    def make_key(url: str, params: Dict | None = None) -> str:
+        raw = json.dumps([url, sorted((params or {}).items())], default=str)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def lookup(self, url: str, params: Dict | None = None) -> CachedResponse | None:
+        """Return the stored entry (fresh or stale), counting a hit when it can skip the network."""
+        key = self.make_key(url, params)
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT body, etag, last_modified, fresh_until FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            conn.commit()
+            entry = CachedResponse(json.loads(row[0]), row[1], row[2], row[3])
+            if entry.is_fresh:
+                self._stats["hits"] += 1
+            return entry
+
+    def store(self, url: str, params: Dict | None, body: Dict | List, headers: Dict[str, str]) -> None:
+        """Record a full 200 response (a miss) and trim the cache back under its size budget."""
+        encoded = json.dumps(body)
+        now = time.time()
+        with self._lock:
+            self._stats["misses"] += 1
+            conn = self._connection()
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO responses
+                    (key, url, etag, last_modified, body, size, fresh_until, accessed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    self.make_key(url, params),
+                    url,
+                    headers.get("ETag", ""),
+                    headers.get("Last-Modified", ""),
+                    encoded,
+                    len(encoded),
+                    now + _max_age(headers),
+                    now,
+                ),
+            )
+            self._evict(conn)
+            conn.commit()
+
+    def mark_revalidated(self, url: str, params: Dict | None, headers: Dict[str, str]) -> None:
+        """Extend the freshness of an entry after the server answered 304 Not Modified."""
+        with self._lock:
+            self._stats["revalidated"] += 1
+            conn = self._connection()
+            conn.execute(
+                "UPDATE responses SET fresh_until = ? WHERE key = ?",
+                (time.time() + _max_age(headers), self.make_key(url, params)),
+            )
+            conn.commit()
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, size in conn.execute("SELECT key, size FROM responses ORDER BY accessed_at").fetchall():
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._stats["evictions"] += 1
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+    def clear(self) -> None:
+        with self._lock:
+            conn = self._connection()
+            conn.execute("DELETE FROM responses")
+            conn.commit()
+            self._stats = dict.fromkeys(self._stats, 0)
+
+
+class TTLStore:
+    """JSON values with a time-to-live, kept in one SQLite table shared by all worker processes."""
+
+    def __init__(self, path: str | Path, table: str, ttl: float) -> None:
+        self.path = Path(path)
+        self.table = table
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._stats = {"hits": 0, "misses": 0}
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = _connect(self.path)
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            row = self._connection().execute(
+                f"SELECT value FROM {self.table} WHERE key = ? AND expires_at > ?", (key, time.time())
+            ).fetchone()
+            self._stats["hits" if row else "misses"] += 1
+        return json.loads(row[0]) if row else default
+
+    def set(self, key: str, value: Any) -> None:
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value), now + self.ttl),
+            )
+            conn.execute(f"DELETE FROM {self.table} WHERE expires_at <= ?", (now,))
+            conn.commit()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+    def clear(self) -> None:
+        with self._lock:
+            conn = self._connection()
+            conn.execute(f"DELETE FROM {self.table}")
+            conn.commit()
+            self._stats = dict.fromkeys(self._stats, 0)
+
+
+def _max_age(headers: Dict[str, str]) -> int:
+    match = _MAX_AGE_RE.search(headers.get("Cache-Control", ""))
+    return int(match.group(1)) if match else 0
@@ -0,0 +1,108 @@
+"""Offline GitHub snapshot: build it ahead of time, load it at startup for a zero-network first paint.
+
+Build (e.g. in the container image or a cron job):
+
+    python snapshot.py build
+
+The app restores the snapshot once per process when it is younger than
+``GITHUB_CONFIG["snapshot_max_age"]`` and otherwise fetches live as before.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict
+
+SNAPSHOT_VERSION = 1
+DEFAULT_SNAPSHOT_PATH = Path(
+    os.getenv("GITHUB_SNAPSHOT_PATH", Path(__file__).parent / ".cache" / "github_snapshot.json")
+)
+
+_RESTORED = False
+
+
+def build_snapshot(path: Path = DEFAULT_SNAPSHOT_PATH) -> Dict:
+    """Fetch everything the first render needs and write it atomically to ``path``."""
+    from data import GITHUB_CONFIG, PROJECT_SHORTLIST
+    from github_api import snapshot_state
+
+    snapshot = {
+        "version": SNAPSHOT_VERSION,
+        "built_at": time.time(),
+        "state": snapshot_state(
+            GITHUB_CONFIG["username"],
+            GITHUB_CONFIG["topic"],
+            PROJECT_SHORTLIST,
+            backend=GITHUB_CONFIG.get("backend", "rest"),
+        ),
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(snapshot), encoding="utf-8")
+    os.replace(tmp_path, path)
+    return snapshot
+
+
+def load_snapshot(path: Path = DEFAULT_SNAPSHOT_PATH, max_age: float | None = None) -> Dict | None:
+    """Return the snapshot if it exists, matches ``SNAPSHOT_VERSION`` and is younger than ``max_age``."""
+    try:
+        snapshot = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if snapshot.get("version") != SNAPSHOT_VERSION:
+        return None
+    if max_age is not None and time.time() - snapshot.get("built_at", 0) > max_age:
+        return None
+    return snapshot
+
+
+def restore_once(config: Dict, path: Path = DEFAULT_SNAPSHOT_PATH) -> bool:
+    """Seed the GitHub caches from a fresh, matching snapshot the first time a process calls this."""
+    global _RESTORED
+    if _RESTORED:
+        return False
+    _RESTORED = True
+
+    snapshot = load_snapshot(path, max_age=config.get("snapshot_max_age"))
+    if snapshot is None:
+        return False
+    state = snapshot["state"]
+    if (state["username"], state["topic"], state["backend"]) != (
+        config["username"],
+        config["topic"],
+        config.get("backend", "rest"),
+    ):
+        return False
+
+    from github_api import restore_state
+
+    restore_state(state, snapshot["built_at"])
+    return True
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("command", choices=["build", "show"])
+    parser.add_argument("--path", type=Path, default=DEFAULT_SNAPSHOT_PATH)
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        snapshot = build_snapshot(args.path)
+    else:
+        snapshot = load_snapshot(args.path)
+        if snapshot is None:
+            raise SystemExit(f"No usable snapshot at {args.path}")
+
+    state = snapshot["state"]
+    age_minutes = (time.time() - snapshot["built_at"]) / 60
+    print(
+        f"{args.path}: v{snapshot['version']}, {age_minutes:.0f} min old, "
+        f"{len(state['repositories'])} repos, {len(state['shortlist'])} shortlist hydrations"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Stale-while-revalidate memoisation for slow, failure-prone fetchers."""
+from __future__ import annotations
+
+import copy
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict
+
+logger = logging.getLogger(__name__)
+
+
+class _Entry:
+    __slots__ = ("value", "fetched_at", "refresh_after")
+
+    def __init__(self, value: Any, fetched_at: float | None, refresh_after: float) -> None:
+        self.value = value
+        self.fetched_at = fetched_at
+        self.refresh_after = refresh_after
+
+
+def stale_while_revalidate(
+    ttl: float,
+    retry_after: float = 60.0,
+    is_valid: Callable[[Any], bool] = bool,
+) -> Callable:
+    """Serve the last good result immediately and refresh it on a background thread once ``ttl`` lapses.
+
+    Only the first call for a key blocks. After that, an expired entry is returned as-is while a single
+    background refresh per key replaces it. Results rejected by ``is_valid`` (an outage, an empty feed)
+    never overwrite a good entry; the stale value stays and another refresh is tried after
+    ``retry_after`` seconds. The wrapper exposes ``last_updated(*args, **kwargs)``, ``clear()`` and
+    ``prime(value, fetched_at, *args, **kwargs)`` for seeding an entry from an offline snapshot.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+        entries: Dict[str, _Entry] = {}
+        in_flight: set[str] = set()
+        lock = threading.Lock()
+        key_locks: Dict[str, threading.Lock] = defaultdict(threading.Lock)
+
+        def _key(args: tuple, kwargs: dict) -> str:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            raw = json.dumps(sorted(bound.arguments.items()), default=str)
+            return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+        def _store(key: str, value: Any) -> None:
+            now = time.time()
+            with lock:
+                current = entries.get(key)
+                if is_valid(value):
+                    entries[key] = _Entry(value, now, now + ttl)
+                elif current is not None and is_valid(current.value):
+                    current.refresh_after = now + retry_after
+                else:
+                    # No good data yet: nothing to report as "last updated".
+                    entries[key] = _Entry(value, None, now + retry_after)
+
+        def _refresh(key: str, args: tuple, kwargs: dict) -> None:
+            try:
+                _store(key, func(*args, **kwargs))
+            except Exception:  # pragma: no cover - keep serving stale data
+                logger.exception("Background refresh of %s failed", func.__name__)
+                with lock:
+                    if key in entries:
+                        entries[key].refresh_after = time.time() + retry_after
+            finally:
+                with lock:
+                    in_flight.discard(key)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = _key(args, kwargs)
+            with lock:
+                entry = entries.get(key)
+                start_refresh = entry is not None and time.time() >= entry.refresh_after and key not in in_flight
+                if start_refresh:
+                    in_flight.add(key)
+
+            if entry is None:
+                # Cold key: block, but let concurrent first callers share a single fetch.
+                with key_locks[key]:
+                    with lock:
+                        entry = entries.get(key)
+                    if entry is None:
+                        _store(key, func(*args, **kwargs))
+                        with lock:
+                            entry = entries[key]
+            elif start_refresh:
+                threading.Thread(
+                    target=_refresh, args=(key, args, kwargs), name=f"swr-{func.__name__}", daemon=True
+                ).start()
+
+            return copy.deepcopy(entry.value)
+
+        def last_updated(*args, **kwargs) -> float | None:
+            """Epoch seconds when the served value was fetched, or ``None`` if no good data exists yet."""
+            with lock:
+                entry = entries.get(_key(args, kwargs))
+            return entry.fetched_at if entry is not None else None
+
+        def prime(value: Any, fetched_at: float, *args, **kwargs) -> None:
+            """Seed an entry as if it had been fetched at ``fetched_at``; newer entries are kept."""
+            key = _key(args, kwargs)
+            with lock:
+                current = entries.get(key)
+                if current is None or (current.fetched_at or 0) < fetched_at:
+                    entries[key] = _Entry(value, fetched_at, fetched_at + ttl)
+
+        def clear() -> None:
+            with lock:
+                entries.clear()
+
+        wrapper.last_updated = last_updated
+        wrapper.clear = clear
+        wrapper.prime = prime
+        return wrapper
+
+    return decorator